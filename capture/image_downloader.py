@@ -11,6 +11,7 @@ from urllib.parse import urlparse, unquote
 from PIL import Image, ExifTags
 from io import BytesIO
 from dotenv import load_dotenv
+from utils.thumbnail import create_thumbnail
 
 load_dotenv()
 
@@ -24,6 +25,20 @@ class ImageDownloader:
         self.timeout = int(os.getenv("IMAGE_DOWNLOAD_TIMEOUT", 30))
         self.max_file_size = 50 * 1024 * 1024  # 50MB max
         self.valid_extensions = {'.jpg', '.jpeg', '.png', '.gif', '.webp', '.bmp'}
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Shared client session so TCP/TLS connections are reused across downloads"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, limit_per_host=8, keepalive_timeout=60)
+            )
+        return self._session
+
+    async def close(self):
+        """Close the shared client session"""
+        if self._session and not self._session.closed:
+            await self._session.close()
 
     async def download_image(self, image_url: str, category: str = "general") -> Optional[Dict]:
         """
@@ -37,37 +52,37 @@ class ImageDownloader:
             Dictionary with image info and file path, or None if failed
         """
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    image_url,
-                    timeout=aiohttp.ClientTimeout(total=self.timeout),
-                    headers={
-                        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-                    }
-                ) as response:
-
-                    # Check response status
-                    if response.status != 200:
-                        print(f"   ✗ HTTP {response.status} for {image_url[:50]}...")
-                        return None
-
-                    # Check content type
-                    content_type = response.headers.get('Content-Type', '')
-                    if not content_type.startswith('image/'):
-                        print(f"   ✗ Not an image: {content_type}")
-                        return None
-
-                    # Check file size
-                    content_length = response.headers.get('Content-Length')
-                    if content_length and int(content_length) > self.max_file_size:
-                        print(f"   ✗ Image too large: {int(content_length) / 1024 / 1024:.1f}MB")
-                        return None
-
-                    # Download image data
-                    image_data = await response.read()
-
-                    # Process and save image
-                    return await self._process_and_save_image(image_data, image_url, category)
+            session = self._get_session()
+            async with session.get(
+                image_url,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers={
+                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+                }
+            ) as response:
+
+                # Check response status
+                if response.status != 200:
+                    print(f"   ✗ HTTP {response.status} for {image_url[:50]}...")
+                    return None
+
+                # Check content type
+                content_type = response.headers.get('Content-Type', '')
+                if not content_type.startswith('image/'):
+                    print(f"   ✗ Not an image: {content_type}")
+                    return None
+
+                # Check file size
+                content_length = response.headers.get('Content-Length')
+                if content_length and int(content_length) > self.max_file_size:
+                    print(f"   ✗ Image too large: {int(content_length) / 1024 / 1024:.1f}MB")
+                    return None
+
+                # Download image data
+                image_data = await response.read()
+
+                # Process and save image
+                return await self._process_and_save_image(image_data, image_url, category)
 
         except asyncio.TimeoutError:
             print(f"   ✗ Timeout downloading image from {image_url[:50]}...")
@@ -125,6 +140,10 @@ class ImageDownloader:
             # Calculate file size
             file_size = filepath.stat().st_size
 
+            # Reading the file back and encoding the JPEG would stall every other
+            # download, so the thumbnail is built in a worker thread
+            thumbnail_b64 = await asyncio.to_thread(create_thumbnail, str(filepath))
+
             print(f"   ✓ Image saved: {filename} ({width}x{height}, {file_size/1024:.1f}KB)")
 
             return {
@@ -135,6 +154,7 @@ class ImageDownloader:
                 'image_height': height,
                 'image_format': format_name.lower(),
                 'download_url': url,
+                'thumbnail_b64': thumbnail_b64,
                 'exif_data': exif_data,
                 'capture_date': exif_data.get('DateTimeOriginal') if exif_data else None,
                 'location_data': self._extract_gps(exif_data) if exif_data else None
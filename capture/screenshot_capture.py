@@ -6,11 +6,14 @@ import hashlib
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, Dict, List
-from playwright.async_api import async_playwright, Browser, Page
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# Warm browser contexts kept for page screenshots; captures beyond this wait for one
+PAGE_CONTEXT_POOL_SIZE = 4
+
 class ScreenshotCapture:
     """Capture screenshots of web pages and search results"""
 
@@ -18,23 +21,97 @@ class ScreenshotCapture:
         self.screenshot_path = Path(os.getenv("SCREENSHOT_STORAGE_PATH",
                                               "/Volumes/X5/_CODE_PROJECTS/DPRK/captured_data/screenshots"))
         self.screenshot_path.mkdir(parents=True, exist_ok=True)
+        self.playwright = None
         self.browser: Optional[Browser] = None
+        # Gallery renders reuse one context and page; only the HTML changes per query
+        self.gallery_context: Optional[BrowserContext] = None
+        self.gallery_page: Optional[Page] = None
+        self.gallery_lock = asyncio.Lock()
+        # Page captures check a context out of this pool instead of creating one per page.
+        # The semaphore caps contexts in use; the queue only holds idle ones
+        self.page_contexts: asyncio.Queue = asyncio.Queue()
+        self.page_context_slots = asyncio.Semaphore(PAGE_CONTEXT_POOL_SIZE)
+        self._created_dirs = set()  # Screenshot subdirectories known to exist
         self.timeout = int(os.getenv("SCREENSHOT_TIMEOUT", 60)) * 1000  # Convert to ms
 
     async def initialize(self):
         """Initialize Playwright browser"""
         if not self.browser:
-            playwright = await async_playwright().start()
-            self.browser = await playwright.chromium.launch(
+            self.playwright = await async_playwright().start()
+            self.browser = await self.playwright.chromium.launch(
                 headless=True,
                 args=['--no-sandbox', '--disable-setuid-sandbox']
             )
 
     async def close(self):
         """Close browser instance"""
+        while not self.page_contexts.empty():
+            await self.page_contexts.get_nowait().close()
+        if self.gallery_context:
+            await self.gallery_context.close()
+            self.gallery_context = None
+            self.gallery_page = None
         if self.browser:
             await self.browser.close()
             self.browser = None
+        if self.playwright:
+            await self.playwright.stop()
+            self.playwright = None
+
+    async def _get_gallery_page(self) -> Page:
+        """Return the persistent gallery page, creating it on first use"""
+        if not self.gallery_page or self.gallery_page.is_closed():
+            if not self.gallery_context:
+                self.gallery_context = await self.browser.new_context(
+                    viewport={"width": 1920, "height": 1080}
+                )
+            self.gallery_page = await self.gallery_context.new_page()
+        return self.gallery_page
+
+    def _screenshot_file(self, prefix: str, key: str, *subdirs: str) -> Path:
+        """Build a dated screenshot path, creating its directory once per run"""
+        now = datetime.now()
+        date_str = now.strftime("%Y-%m-%d")
+        key_hash = hashlib.md5(key.encode()).hexdigest()[:8]
+        filename = f"{prefix}{date_str}_{key_hash}_{now.strftime('%H%M%S')}.png"
+
+        date_dir = self.screenshot_path.joinpath(date_str, *subdirs)
+        if date_dir not in self._created_dirs:
+            date_dir.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(date_dir)
+        return date_dir / filename
+
+    async def _new_page_context(self) -> BrowserContext:
+        """Create a context for page screenshots"""
+        return await self.browser.new_context(
+            viewport={"width": 1920, "height": 1080},
+            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+        )
+
+    async def _acquire_page_context(self) -> BrowserContext:
+        """Check out an idle pooled context, or create one once a slot is free"""
+        await self.page_context_slots.acquire()
+        if not self.page_contexts.empty():
+            return self.page_contexts.get_nowait()
+        try:
+            return await self._new_page_context()
+        except Exception:
+            self.page_context_slots.release()
+            raise
+
+    def _release_page_context(self, context: BrowserContext):
+        """Return a healthy context to the pool"""
+        self.page_contexts.put_nowait(context)
+        self.page_context_slots.release()
+
+    async def _discard_page_context(self, context: BrowserContext):
+        """Close a context that may be unusable and free its slot; the next capture makes a new one"""
+        try:
+            await context.close()
+        except Exception:
+            pass
+        finally:
+            self.page_context_slots.release()
 
     async def capture_page_screenshot(self, url: str, full_page: bool = True) -> Optional[str]:
         """
@@ -48,13 +125,14 @@ class ScreenshotCapture:
             Path to saved screenshot or None if failed
         """
         await self.initialize()
+        # Output path is fixed up front; Playwright writes the PNG straight to it
+        filepath = self._screenshot_file("", url)
+        filename = filepath.name
+        context = await self._acquire_page_context()
 
         try:
-            # Create new page
-            page = await self.browser.new_page(
-                viewport={"width": 1920, "height": 1080},
-                user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-            )
+            # Create new page in a pooled context
+            page = await context.new_page()
 
             # Navigate to URL
             await page.goto(url, wait_until="networkidle", timeout=self.timeout)
@@ -63,17 +141,6 @@ class ScreenshotCapture:
             await page.wait_for_load_state("domcontentloaded")
             await asyncio.sleep(2)  # Additional wait for dynamic content
 
-            # Generate filename
-            date_str = datetime.now().strftime("%Y-%m-%d")
-            url_hash = hashlib.md5(url.encode()).hexdigest()[:8]
-            timestamp = datetime.now().strftime("%H%M%S")
-            filename = f"{date_str}_{url_hash}_{timestamp}.png"
-
-            # Create date-based subdirectory
-            date_dir = self.screenshot_path / date_str
-            date_dir.mkdir(exist_ok=True)
-            filepath = date_dir / filename
-
             # Take screenshot
             await page.screenshot(
                 path=str(filepath),
@@ -82,6 +149,7 @@ class ScreenshotCapture:
             )
 
             await page.close()
+            self._release_page_context(context)
 
             print(f"   ✓ Screenshot saved: {filename}")
             return str(filepath)
@@ -89,7 +157,12 @@ class ScreenshotCapture:
         except Exception as e:
             print(f"   ✗ Failed to capture screenshot of {url}: {e}")
             if 'page' in locals():
-                await page.close()
+                try:
+                    await page.close()
+                except Exception:
+                    pass
+            # A failed page can leave its context in a bad state, so don't reuse it
+            await self._discard_page_context(context)
             return None
 
     async def capture_search_results(self, query: str, results_html: str) -> Optional[str]:
@@ -115,15 +188,8 @@ class ScreenshotCapture:
             await page.wait_for_load_state("domcontentloaded")
 
             # Generate filename
-            date_str = datetime.now().strftime("%Y-%m-%d")
-            query_hash = hashlib.md5(query.encode()).hexdigest()[:8]
-            timestamp = datetime.now().strftime("%H%M%S")
-            filename = f"search_{date_str}_{query_hash}_{timestamp}.png"
-
-            # Create subdirectory
-            date_dir = self.screenshot_path / date_str / "search_results"
-            date_dir.mkdir(parents=True, exist_ok=True)
-            filepath = date_dir / filename
+            filepath = self._screenshot_file("search_", query, "search_results")
+            filename = filepath.name
 
             # Take screenshot
             await page.screenshot(
@@ -160,43 +226,35 @@ class ScreenshotCapture:
             # Create HTML gallery
             gallery_html = self._create_gallery_html(image_urls, query)
 
-            page = await self.browser.new_page(
-                viewport={"width": 1920, "height": 1080}
-            )
+            async with self.gallery_lock:
+                page = await self._get_gallery_page()
 
-            await page.set_content(gallery_html)
-            await page.wait_for_load_state("networkidle")
+                await page.set_content(gallery_html)
+                await page.wait_for_load_state("networkidle")
 
-            # Wait for images to load
-            await asyncio.sleep(3)
-
-            # Generate filename
-            date_str = datetime.now().strftime("%Y-%m-%d")
-            query_hash = hashlib.md5(query.encode()).hexdigest()[:8]
-            timestamp = datetime.now().strftime("%H%M%S")
-            filename = f"gallery_{date_str}_{query_hash}_{timestamp}.png"
+                # Wait for images to load
+                await asyncio.sleep(3)
 
-            # Create subdirectory
-            date_dir = self.screenshot_path / date_str / "galleries"
-            date_dir.mkdir(parents=True, exist_ok=True)
-            filepath = date_dir / filename
-
-            # Take screenshot
-            await page.screenshot(
-                path=str(filepath),
-                full_page=True,
-                type="png"
-            )
+                # Generate filename
+                filepath = self._screenshot_file("gallery_", query, "galleries")
+                filename = filepath.name
 
-            await page.close()
+                # Take screenshot
+                await page.screenshot(
+                    path=str(filepath),
+                    full_page=True,
+                    type="png"
+                )
 
             print(f"   ✓ Gallery screenshot saved: {filename}")
             return str(filepath)
 
         except Exception as e:
             print(f"   ✗ Failed to capture gallery: {e}")
-            if 'page' in locals():
-                await page.close()
+            # Drop the page so the next gallery starts from a fresh one
+            if self.gallery_page:
+                await self.gallery_page.close()
+                self.gallery_page = None
             return None
 
     def _create_gallery_html(self, image_urls: List[str], query: str) -> str:
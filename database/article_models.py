@@ -1,6 +1,6 @@
 """SQLAlchemy models for article/text content analysis"""
 
-from sqlalchemy import Column, Integer, String, Text, Float, DateTime, Boolean, ForeignKey, ARRAY, UniqueConstraint, JSON
+from sqlalchemy import Column, Integer, String, Text, Float, DateTime, Boolean, ForeignKey, ARRAY, UniqueConstraint, Index, JSON, Computed
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -81,6 +81,11 @@ class ArticleContent(Base):
     # Relationships
     result = relationship("ArticleResult", back_populates="content")
 
+    # Partial index for the pipeline status count of successful scrapes
+    __table_args__ = (
+        Index('ix_article_content_scrape_success', 'scrape_success', postgresql_where=scrape_success),
+    )
+
 
 class ArticleAnalysis(Base):
     """Store Gemma3:12b analysis of articles"""
@@ -100,6 +105,11 @@ class ArticleAnalysis(Base):
     concern_level = Column(String(20))  # low, medium, high, critical
     concern_indicators = Column(ARRAY(Text))
     human_rights_issues = Column(ARRAY(Text))
+    # Sort key for "most concerning" reports, kept by the database
+    priority_score = Column(Integer, Computed(
+        "CASE concern_level WHEN 'critical' THEN 2 WHEN 'high' THEN 1 ELSE 0 END",
+        persisted=True
+    ))
 
     # Specific analysis fields
     worker_conditions = Column(Text)
@@ -123,4 +133,12 @@ class ArticleAnalysis(Base):
     error_message = Column(Text)
 
     # Relationships
-    result = relationship("ArticleResult", back_populates="analysis")
\ No newline at end of file
+    result = relationship("ArticleResult", back_populates="analysis")
+
+    # Supports the high/critical concern count in the pipeline status and
+    # the top-N "most concerning" lookups
+    __table_args__ = (
+        Index('ix_article_analysis_concern_level', 'concern_level'),
+        Index('ix_article_analysis_priority_score', priority_score.desc(),
+              postgresql_where=error_message.is_(None)),
+    )
\ No newline at end of file
@@ -0,0 +1,100 @@
+"""Materialized views backing the model comparison report"""
+
+from sqlalchemy import text
+
+# Bump when the view definition changes so existing databases rebuild it
+MODEL_COMPARISON_STATS_VERSION = '2'
+
+# One pass over content_analysis computes the overview (grand total),
+# per-concern-level performance and the concern agreement matrix
+MODEL_COMPARISON_STATS_SQL = """
+    SELECT
+        concat_ws(':', section, concern_level, gemma_concern_level, gemma12b_concern_level) as row_key,
+        stats.*
+    FROM (
+        SELECT
+            CASE
+                WHEN GROUPING(concern_level) = 0 THEN 'performance'
+                WHEN GROUPING(gemma_concern_level) = 0 THEN 'agreement'
+                ELSE 'overview'
+            END as section,
+            concern_level,
+            gemma_concern_level,
+            gemma12b_concern_level,
+            COUNT(*) as total,
+            COUNT(*) FILTER (WHERE gemma_description IS NOT NULL) as with_gemma3n,
+            COUNT(*) FILTER (WHERE gemma12b_description IS NOT NULL) as with_gemma12b,
+            COUNT(*) FILTER (WHERE gemma_description IS NOT NULL
+                             AND gemma12b_description IS NOT NULL) as with_both,
+            COUNT(*) FILTER (WHERE gemma_concern_level IS NOT NULL
+                             AND gemma12b_concern_level IS NOT NULL) as compared,
+            COUNT(*) FILTER (WHERE gemma_concern_level = gemma12b_concern_level) as exact_matches,
+            COUNT(*) FILTER (WHERE gemma_concern_level IS NOT NULL) as gemma3n_count,
+            COUNT(*) FILTER (WHERE gemma12b_concern_level IS NOT NULL) as gemma12b_count,
+            AVG(gemma_processing_time) as avg_gemma3n_time,
+            AVG(gemma12b_processing_time) as avg_gemma12b_time,
+            ABS(AVG(gemma12b_processing_time) - AVG(gemma_processing_time)) as speed_diff,
+            COALESCE(ROUND(COUNT(*) FILTER (WHERE gemma_concern_level = 'low') * 100.0
+                / NULLIF(COUNT(*) FILTER (WHERE gemma_concern_level IS NOT NULL), 0), 1), 0) as gemma3n_low_pct,
+            COALESCE(ROUND(COUNT(*) FILTER (WHERE gemma_concern_level = 'medium') * 100.0
+                / NULLIF(COUNT(*) FILTER (WHERE gemma_concern_level IS NOT NULL), 0), 1), 0) as gemma3n_medium_pct,
+            COALESCE(ROUND(COUNT(*) FILTER (WHERE gemma_concern_level = 'high') * 100.0
+                / NULLIF(COUNT(*) FILTER (WHERE gemma_concern_level IS NOT NULL), 0), 1), 0) as gemma3n_high_pct,
+            COALESCE(ROUND(COUNT(*) FILTER (WHERE gemma_concern_level = 'critical') * 100.0
+                / NULLIF(COUNT(*) FILTER (WHERE gemma_concern_level IS NOT NULL), 0), 1), 0) as gemma3n_critical_pct,
+            COALESCE(ROUND(COUNT(*) FILTER (WHERE gemma12b_concern_level = 'low') * 100.0
+                / NULLIF(COUNT(*) FILTER (WHERE gemma12b_concern_level IS NOT NULL), 0), 1), 0) as gemma12b_low_pct,
+            COALESCE(ROUND(COUNT(*) FILTER (WHERE gemma12b_concern_level = 'medium') * 100.0
+                / NULLIF(COUNT(*) FILTER (WHERE gemma12b_concern_level IS NOT NULL), 0), 1), 0) as gemma12b_medium_pct,
+            COALESCE(ROUND(COUNT(*) FILTER (WHERE gemma12b_concern_level = 'high') * 100.0
+                / NULLIF(COUNT(*) FILTER (WHERE gemma12b_concern_level IS NOT NULL), 0), 1), 0) as gemma12b_high_pct,
+            COALESCE(ROUND(COUNT(*) FILTER (WHERE gemma12b_concern_level = 'critical') * 100.0
+                / NULLIF(COUNT(*) FILTER (WHERE gemma12b_concern_level IS NOT NULL), 0), 1), 0) as gemma12b_critical_pct
+        FROM content_analysis
+        GROUP BY GROUPING SETS (
+            (),
+            (concern_level),
+            (gemma_concern_level, gemma12b_concern_level)
+        )
+        HAVING (GROUPING(concern_level) = 1 OR concern_level IS NOT NULL)
+        AND (GROUPING(gemma_concern_level) = 1
+             OR (gemma_concern_level IS NOT NULL AND gemma12b_concern_level IS NOT NULL))
+    ) stats
+"""
+
+
+def create_model_comparison_stats(conn):
+    """Create the model_comparison_stats view (unpopulated) and its unique key"""
+    conn.execute(text(f"""
+        CREATE MATERIALIZED VIEW IF NOT EXISTS model_comparison_stats AS
+        {MODEL_COMPARISON_STATS_SQL}
+        WITH NO DATA
+    """))
+    # REFRESH ... CONCURRENTLY requires a unique index covering every row
+    conn.execute(text("""
+        CREATE UNIQUE INDEX IF NOT EXISTS ix_model_comparison_stats_row_key
+        ON model_comparison_stats (row_key)
+    """))
+    conn.execute(text(
+        f"COMMENT ON MATERIALIZED VIEW model_comparison_stats IS '{MODEL_COMPARISON_STATS_VERSION}'"
+    ))
+
+
+def refresh_model_comparison_stats(conn):
+    """Refresh model_comparison_stats, rebuilding it first if missing or outdated"""
+    state = conn.execute(text("""
+        SELECT
+            obj_description(to_regclass('model_comparison_stats'), 'pg_class') as version,
+            (SELECT ispopulated FROM pg_matviews
+             WHERE matviewname = 'model_comparison_stats') as populated
+    """)).one()
+
+    populated = state.populated
+    if state.version != MODEL_COMPARISON_STATS_VERSION:
+        conn.execute(text("DROP MATERIALIZED VIEW IF EXISTS model_comparison_stats"))
+        create_model_comparison_stats(conn)
+        populated = False
+
+    # CONCURRENTLY keeps the view readable but only works once it holds data
+    concurrently = 'CONCURRENTLY ' if populated else ''
+    conn.execute(text(f"REFRESH MATERIALIZED VIEW {concurrently}model_comparison_stats"))
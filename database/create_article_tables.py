@@ -5,9 +5,38 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from sqlalchemy import text
 from database.connection import engine
 from database.article_models import Base
 
+# Columns added after the tables were first created; create_all never alters a table
+ARTICLE_COLUMNS = [
+    """
+    ALTER TABLE article_analysis ADD COLUMN IF NOT EXISTS priority_score INTEGER
+    GENERATED ALWAYS AS (
+        CASE concern_level WHEN 'critical' THEN 2 WHEN 'high' THEN 1 ELSE 0 END
+    ) STORED
+    """,
+]
+
+# Status-count and report indexes; create_all only adds these when it creates the table
+ARTICLE_INDEXES = [
+    """
+    CREATE INDEX IF NOT EXISTS ix_article_content_scrape_success
+    ON article_content (scrape_success)
+    WHERE scrape_success
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS ix_article_analysis_concern_level
+    ON article_analysis (concern_level)
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS ix_article_analysis_priority_score
+    ON article_analysis (priority_score DESC)
+    WHERE error_message IS NULL
+    """,
+]
+
 def create_article_tables():
     """Create all article-related tables"""
     print("Creating article analysis tables...")
@@ -15,6 +44,10 @@ def create_article_tables():
     # Create all tables defined in article_models
     Base.metadata.create_all(engine, checkfirst=True)
 
+    with engine.begin() as conn:
+        for statement in ARTICLE_COLUMNS + ARTICLE_INDEXES:
+            conn.execute(text(statement))
+
     print("✅ Article tables created successfully:")
     print("   - article_searches")
     print("   - article_results")
@@ -1,6 +1,6 @@
 """SQLAlchemy models for DPRK image capture system"""
 
-from sqlalchemy import Column, Integer, String, Text, Float, DateTime, Boolean, ForeignKey, ARRAY, UniqueConstraint, JSON
+from sqlalchemy import Column, Integer, String, Text, Float, DateTime, Boolean, ForeignKey, ARRAY, UniqueConstraint, Index, JSON
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -19,6 +19,7 @@ class SearchQuery(Base):
     language = Column(String(10), default='en')  # en, ru, ko, zh, fr
     search_type = Column(String(20), default='images')  # images, web
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+    last_searched_at = Column(DateTime(timezone=True))  # Last SERP call, even if it found nothing
 
     # Relationships
     results = relationship("SearchResult", back_populates="query", cascade="all, delete-orphan")
@@ -52,8 +53,13 @@ class SearchResult(Base):
     screenshots = relationship("Screenshot", back_populates="search_result", cascade="all, delete-orphan")
     content_analysis = relationship("ContentAnalysis", back_populates="search_result", uselist=False, cascade="all, delete-orphan")
 
-    # Unique constraint
-    __table_args__ = (UniqueConstraint('query_id', 'url', name='_query_url_uc'),)
+    # Unique constraint; the image URL index serves both equality and prefix (LIKE 'x%')
+    # lookups from the dedup pipeline
+    __table_args__ = (
+        UniqueConstraint('query_id', 'url', name='_query_url_uc'),
+        Index('ix_search_result_image_url_lower', func.lower(image_url).label('image_url_lower'),
+              postgresql_ops={'image_url_lower': 'text_pattern_ops'}),
+    )
 
 class CapturedImage(Base):
     """Store captured/downloaded images"""
@@ -68,6 +74,7 @@ class CapturedImage(Base):
     image_height = Column(Integer)
     image_format = Column(String(10))  # jpg, png, gif, etc.
     download_url = Column(Text)
+    thumbnail_b64 = Column(Text)  # base64 JPEG thumbnail for the dashboard
 
     # Metadata
     exif_data = Column(JSON)
@@ -80,6 +87,9 @@ class CapturedImage(Base):
     # Relationships
     search_result = relationship("SearchResult", back_populates="captured_images")
 
+    # Analysed images are resolved back to their result by path
+    __table_args__ = (Index('ix_captured_image_file_path', 'file_path'),)
+
 class Screenshot(Base):
     """Store screenshots of search results or web pages"""
     __tablename__ = 'screenshots'
@@ -132,6 +142,12 @@ class ContentAnalysis(Base):
     gemma_indicators = Column(ARRAY(Text))
     gemma_processing_time = Column(Float)
 
+    # Gemma3:12b analysis fields (model comparison pass)
+    gemma12b_description = Column(Text)
+    gemma12b_concern_level = Column(String(20))
+    gemma12b_indicators = Column(ARRAY(Text))
+    gemma12b_processing_time = Column(Float)
+
     # Ensemble analysis fields (combined results)
     ensemble_concern_level = Column(String(20))  # low, medium, high, critical
     ensemble_confidence = Column(Float)  # 0-1 confidence in ensemble result
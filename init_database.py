@@ -1,17 +1,57 @@
 #!/usr/bin/env python3
 """Initialize DPRK database schema and load search terms"""
 
+import io
+import re
 import sys
 import os
 from pathlib import Path
+import numpy as np
+import pandas as pd
 from dotenv import load_dotenv
 from sqlalchemy import create_engine, text
 from database.models import Base, SearchQuery
 from database.connection import engine, get_session
+from database.comparison_views import create_model_comparison_stats
 from search_terms.dprk_images_search_terms import search_terms_comprehensive
 
 load_dotenv()
 
+# Language detection based on script or keywords, checked in priority order
+LANGUAGE_PATTERNS = [
+    ('ru', re.compile(r'[\u0400-\u04FF]')),  # Cyrillic
+    ('ko', re.compile(r'[\uAC00-\uD7AF]')),  # Korean
+    ('zh', re.compile(r'[\u4E00-\u9FFF]')),  # Chinese
+    ('fr', re.compile(r'travailleurs|soldats', re.IGNORECASE)),  # French
+]
+
+# Category detection based on keywords, checked in priority order
+CATEGORY_PATTERNS = [
+    ('labour_type', re.compile(r'construction|строител|건설', re.IGNORECASE)),
+    ('military', re.compile(r'soldier|солдат|병사', re.IGNORECASE)),
+    ('community', re.compile(r'student|студент|유학생', re.IGNORECASE)),
+    ('region', re.compile(r'Far East|Kursk|Vladivostok|Дальнего Востока')),
+    ('hybrid', re.compile(r'guard|supervis|надзор', re.IGNORECASE)),
+]
+
+def _first_match(terms, patterns, default):
+    """Label each term with the first pattern it matches, in priority order"""
+    return np.select(
+        [terms.str.contains(pattern) for _, pattern in patterns],
+        [label for label, _ in patterns],
+        default=default
+    )
+
+def classify_terms(terms):
+    """Classify search terms into a search_queries-shaped DataFrame"""
+    terms = pd.Series(terms, dtype=object)
+    return pd.DataFrame({
+        'search_term': terms,
+        'language': _first_match(terms, LANGUAGE_PATTERNS, 'en'),
+        'category': _first_match(terms, CATEGORY_PATTERNS, 'general'),
+        'search_type': 'images'
+    })
+
 def create_database():
     """Create database if it doesn't exist"""
     db_name = os.getenv("DB_NAME", "dprk")
@@ -36,62 +76,106 @@ def create_database():
         else:
             print(f"✓ Database '{db_name}' already exists")
 
+# Partial indexes supporting the gemma3n:e4b vs gemma3:12b comparison report
+COMPARISON_INDEXES = [
+    """
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_ca_concern_pair
+    ON content_analysis (gemma_concern_level, gemma12b_concern_level)
+    WHERE gemma_concern_level IS NOT NULL AND gemma12b_concern_level IS NOT NULL
+    """,
+    """
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_ca_gemma_processing_time
+    ON content_analysis (gemma_processing_time)
+    WHERE gemma_processing_time IS NOT NULL
+    """,
+    """
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_ca_gemma12b_processing_time
+    ON content_analysis (gemma12b_processing_time)
+    WHERE gemma12b_processing_time IS NOT NULL
+    """,
+]
+
+# Columns added to the capture tables after release; create_all skips existing tables
+PIPELINE_COLUMNS = [
+    """
+    ALTER TABLE captured_images ADD COLUMN IF NOT EXISTS thumbnail_b64 TEXT
+    """,
+    """
+    ALTER TABLE search_queries ADD COLUMN IF NOT EXISTS last_searched_at TIMESTAMPTZ
+    """,
+]
+
+# Lookup indexes for the capture pipeline; create_all only adds these to new tables
+PIPELINE_INDEXES = [
+    """
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_captured_image_file_path
+    ON captured_images (file_path)
+    """,
+    """
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_search_result_image_url_lower
+    ON search_results (lower(image_url) text_pattern_ops)
+    """,
+]
+
 def create_tables():
     """Create all tables from models"""
     print("Creating tables...")
     Base.metadata.create_all(bind=engine)
     print("✓ All tables created successfully")
 
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with engine.connect() as conn:
+        conn = conn.execution_options(isolation_level="AUTOCOMMIT")
+        for statement in PIPELINE_COLUMNS + PIPELINE_INDEXES + COMPARISON_INDEXES:
+            conn.execute(text(statement))
+    print("✓ Pipeline columns, pipeline and comparison indexes created")
+
+    with engine.begin() as conn:
+        create_model_comparison_stats(conn)
+    print("✓ Comparison statistics view created")
+
+def clear_search_terms(session):
+    """Remove existing search terms, truncating when no other rows reference them"""
+    referenced = session.execute(text("""
+        SELECT EXISTS (SELECT 1 FROM search_results)
+            OR EXISTS (SELECT 1 FROM search_sessions)
+    """)).scalar()
+
+    if referenced:
+        # Keep DELETE so dependent rows raise a foreign key error rather than being wiped
+        session.query(SearchQuery).delete()
+    else:
+        # Every referencing table is empty, so CASCADE only clears empty tables
+        session.execute(text("TRUNCATE TABLE search_queries RESTART IDENTITY CASCADE"))
+    session.commit()
+
 def load_search_terms():
     """Load search terms into database"""
     session = get_session()
 
     try:
         # Clear existing search terms
-        session.query(SearchQuery).delete()
-        session.commit()
-
-        loaded_count = 0
-
-        for idx, term in enumerate(search_terms_comprehensive):
-            # Determine language and category from term
-            language = 'en'  # Default
-            category = 'general'  # Default
-
-            # Language detection based on script
-            if any(ord(char) >= 0x0400 and ord(char) <= 0x04FF for char in term):
-                language = 'ru'  # Cyrillic
-            elif any(ord(char) >= 0xAC00 and ord(char) <= 0xD7AF for char in term):
-                language = 'ko'  # Korean
-            elif any(ord(char) >= 0x4E00 and ord(char) <= 0x9FFF for char in term):
-                language = 'zh'  # Chinese
-            elif 'travailleurs' in term.lower() or 'soldats' in term.lower():
-                language = 'fr'  # French
-
-            # Category detection based on keywords
-            if 'construction' in term.lower() or 'строител' in term.lower() or '건설' in term:
-                category = 'labour_type'
-            elif 'soldier' in term.lower() or 'солдат' in term.lower() or '병사' in term:
-                category = 'military'
-            elif 'student' in term.lower() or 'студент' in term.lower() or '유학생' in term:
-                category = 'community'
-            elif 'Far East' in term or 'Kursk' in term or 'Vladivostok' in term or 'Дальнего Востока' in term:
-                category = 'region'
-            elif 'guard' in term.lower() or 'supervis' in term.lower() or 'надзор' in term.lower():
-                category = 'hybrid'
-
-            query = SearchQuery(
-                search_term=term,
-                language=language,
-                category=category,
-                search_type='images'
+        clear_search_terms(session)
+
+        terms = classify_terms(search_terms_comprehensive)
+        buffer = io.StringIO()
+        terms.to_csv(buffer, header=False, index=False)
+        buffer.seek(0)
+
+        # COPY skips per-row SQL parsing; run it on the session's own connection
+        # so the clear and the load commit together
+        cursor = session.connection().connection.cursor()
+        try:
+            cursor.copy_expert(
+                "COPY search_queries (search_term, language, category, search_type) "
+                "FROM STDIN WITH (FORMAT csv)",
+                buffer
             )
-
-            session.add(query)
-            loaded_count += 1
-
+            loaded = cursor.rowcount
+        finally:
+            cursor.close()
         session.commit()
-        print(f"✓ Loaded {loaded_count} search terms into database")
+        print(f"✓ Loaded {loaded} search terms into database")
 
         # Show distribution
         result = session.execute(
@@ -126,7 +210,13 @@ def create_directories():
     ]
 
     for directory in directories:
-        directory.mkdir(parents=True, exist_ok=True)
+        # A single mkdir per leaf; only walk the ancestors when one is missing
+        try:
+            os.mkdir(directory)
+        except FileExistsError:
+            pass
+        except FileNotFoundError:
+            os.makedirs(directory, exist_ok=True)
         print(f"✓ Created directory: {directory}")
 
 def main():
@@ -4,15 +4,20 @@
 import asyncio
 import sys
 import os
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import List, Dict
 from dotenv import load_dotenv
+from sqlalchemy import insert, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 
 # Add project root to path
 sys.path.append(str(Path(__file__).parent))
 
-from database.connection import get_session
+from database.connection import get_async_session
 from database.models import (
     SearchQuery, SearchResult, CapturedImage,
     Screenshot, ContentAnalysis, SearchSession
@@ -25,6 +30,14 @@ from search_terms.dprk_images_search_terms import search_terms_comprehensive
 
 load_dotenv()
 
+# Analyses are flushed once this many images are queued, or after the queue
+# has been idle for the timeout (seconds)
+ANALYSIS_BATCH_SIZE = 8
+ANALYSIS_BATCH_TIMEOUT = 5.0
+
+# Minimum spacing between SERP API calls (seconds)
+SERP_MIN_INTERVAL = 2.0
+
 class DPRKImagePipeline:
     """Main pipeline for image search, capture, and analysis"""
 
@@ -33,7 +46,134 @@ class DPRKImagePipeline:
         self.screenshot_capture = ScreenshotCapture()
         self.image_downloader = ImageDownloader()
         self.analyzer = OllamaAnalyzer()
-        self.session = get_session()
+        self.session = get_async_session()
+        self._last_serp_ts = float('-inf')
+
+    async def _prefetch_searches(self, queries, results_queue: asyncio.Queue):
+        """Run SERP searches ahead of the query currently being processed"""
+        try:
+            for idx, query in enumerate(queries, 1):
+                # Rate limiting: only wait out what remains of the interval since the
+                # last search, as time blocked on a full queue already counts
+                wait = SERP_MIN_INTERVAL - (time.monotonic() - self._last_serp_ts)
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                self._last_serp_ts = time.monotonic()
+
+                search_results = await asyncio.to_thread(
+                    self.serp_client.search_images, query.search_term, num_results=20
+                )
+                await results_queue.put((idx, query, search_results))
+        finally:
+            # Always release the consumer, even if a search raised
+            await results_queue.put(None)
+
+    async def _capture_gallery(self, image_urls: List[str], search_term: str):
+        """Capture a gallery screenshot of the given images, if any"""
+        if not image_urls:
+            return None
+
+        return await self.screenshot_capture.capture_image_gallery(image_urls, search_term)
+
+    async def _store_analyses(self, session: AsyncSession, image_paths: List[str], analyses: List[Dict]) -> int:
+        """Store analyses for a batch of image paths, returning how many were new"""
+        # Create a mapping of image paths to their analyses
+        analysis_by_path = {}
+        for i, analysis in enumerate(analyses):
+            if i < len(image_paths):
+                analysis_by_path[image_paths[i]] = analysis
+
+        # Resolve every analysed path to its result in one query
+        result_id_by_path = {}
+        for file_path, result_id in await session.execute(
+            select(CapturedImage.file_path, CapturedImage.result_id)
+            .where(CapturedImage.file_path.in_(list(analysis_by_path)))
+        ):
+            result_id_by_path.setdefault(file_path, result_id)
+
+        # Results that already have an analysis are only marked completed
+        already_analyzed = {
+            row.result_id for row in await session.execute(
+                select(ContentAnalysis.result_id)
+                .where(ContentAnalysis.result_id.in_(list(result_id_by_path.values())))
+            )
+        }
+
+        # Track which result_ids we've already processed to avoid duplicates
+        processed_result_ids = set()
+        analysis_rows = []
+
+        for img_path, analysis in analysis_by_path.items():
+            result_id = result_id_by_path.get(img_path)
+
+            if result_id is None or result_id in processed_result_ids or result_id in already_analyzed:
+                continue
+
+            analysis_rows.append({
+                'result_id': result_id,
+                'scene_description': analysis.get('scene_description', ''),
+                'location_assessment': analysis.get('location_assessment', ''),
+                'environment_type': analysis.get('environment_type', 'unknown'),
+                'personnel_count': analysis.get('personnel_count', 0),
+                'personnel_types': analysis.get('personnel_types', []),
+                'uniform_identification': analysis.get('uniform_identification', ''),
+                'activity_type': analysis.get('activity_type', 'unknown'),
+                'activity_description': analysis.get('activity_description', ''),
+                'concern_level': analysis.get('concern_level', 'low'),
+                'concern_indicators': analysis.get('concern_indicators', []),
+                'supervision_present': analysis.get('supervision_present', False),
+                'restriction_indicators': analysis.get('restriction_indicators', []),
+                'analysis_model': analysis.get('analysis_model', ''),
+                'confidence_score': analysis.get('confidence_score', 0.0),
+                'processing_time': analysis.get('processing_time', 0.0)
+            })
+            processed_result_ids.add(result_id)
+
+        if analysis_rows:
+            await session.execute(insert(ContentAnalysis), analysis_rows)
+
+        # Mark the search results as analyzed
+        if result_id_by_path:
+            await session.execute(
+                update(SearchResult)
+                .where(SearchResult.id.in_(list(set(result_id_by_path.values()))))
+                .values(analysis_status='completed')
+                .execution_options(synchronize_session=False)
+            )
+
+        return len(processed_result_ids)
+
+    async def _analysis_loop(self, analysis_queue: asyncio.Queue, search_session_id: int):
+        """Analyze queued image paths in batches that span several queries"""
+        while True:
+            # Wait for work, then coalesce until the batch fills or the queue goes quiet
+            batch = [await analysis_queue.get()]
+            while sum(len(paths) for paths in batch) < ANALYSIS_BATCH_SIZE:
+                try:
+                    batch.append(await asyncio.wait_for(analysis_queue.get(), ANALYSIS_BATCH_TIMEOUT))
+                except asyncio.TimeoutError:
+                    break
+
+            image_paths = [path for paths in batch for path in paths]
+            try:
+                analyses = await asyncio.to_thread(self.analyzer.batch_analyze, image_paths)
+
+                # Own session: an AsyncSession cannot be shared with the query loop,
+                # which keeps a transaction open across its awaits
+                async with get_async_session() as session:
+                    self.total_analyses += await self._store_analyses(session, image_paths, analyses)
+                    await session.execute(
+                        update(SearchSession)
+                        .where(SearchSession.id == search_session_id)
+                        .values(analyses_completed=SearchSession.analyses_completed + len(analyses))
+                    )
+                    await session.commit()
+                print(f"   Analyzed {len(analyses)} images")
+            except Exception as e:
+                print(f"   ❌ Analysis batch failed: {e}")
+            finally:
+                for _ in batch:
+                    analysis_queue.task_done()
 
     async def run_pipeline(self, limit_queries: int = None):
         """
@@ -52,38 +192,59 @@ class DPRKImagePipeline:
                 print("⚠ Warning: Ollama not available. Analysis will be skipped.")
                 self.analyzer = None
 
+            # Launch the browser once up front; every gallery reuses it
+            await self.screenshot_capture.initialize()
+
             # Create search session
             search_session = SearchSession(
                 session_name=f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
                 started_at=datetime.now()
             )
             self.session.add(search_session)
-            self.session.commit()
+            await self.session.commit()
 
             # Get search queries
-            queries = self.session.query(SearchQuery).limit(limit_queries).all() if limit_queries else \
-                     self.session.query(SearchQuery).all()
+            # Plain rows rather than ORM objects; only these columns are used
+            stmt = select(
+                SearchQuery.id, SearchQuery.search_term, SearchQuery.language, SearchQuery.category
+            )
+            if limit_queries:
+                stmt = stmt.limit(limit_queries)
+            queries = (await self.session.execute(stmt)).all()
 
             total_queries = len(queries)
             print(f"\n📋 Processing {total_queries} search queries")
 
             total_images_captured = 0
             total_screenshots = 0
-            total_analyses = 0
+            self.total_analyses = 0
+
+            # Analyses run in the background, batched across queries
+            analysis_queue = asyncio.Queue()
+            analysis_worker = asyncio.create_task(
+                self._analysis_loop(analysis_queue, search_session.id)
+            ) if self.analyzer else None
+
+            # Searches for upcoming queries run while the current one is processed
+            results_queue = asyncio.Queue(maxsize=2)
+            prefetch = asyncio.create_task(self._prefetch_searches(queries, results_queue))
+
+            while True:
+                item = await results_queue.get()
+                if item is None:
+                    break
+                idx, query, search_results = item
 
-            for idx, query in enumerate(queries, 1):
                 print(f"\n{'='*60}")
                 print(f"[{idx}/{total_queries}] Query: {query.search_term[:100]}")
                 print(f"Language: {query.language} | Category: {query.category}")
                 print('-' * 60)
 
-                # Update session with current query
+                # Update session with current query; committed with the rest of this query
                 search_session.query_id = query.id
-                self.session.commit()
 
-                # 1. Execute search
+                # 1. Execute search (prefetched by the background task)
                 print("\n1️⃣ Searching for images...")
-                search_results = self.serp_client.search_images(query.search_term, num_results=20)
 
                 if not search_results:
                     print("   No results found")
@@ -93,191 +254,153 @@ class DPRKImagePipeline:
 
                 # 2. Store search results in database
                 print("\n2️⃣ Storing search results...")
-                db_results = []
-                seen_urls = set()  # Track URLs we've already processed
-
+                # Keep the first occurrence of each URL in this batch
+                unique_results = {}
                 for result in search_results:
-                    url = result.get('source_url', '')
-
-                    # Skip if we've already seen this URL in this batch
-                    if url in seen_urls:
-                        continue
-                    seen_urls.add(url)
-
-                    # Check if result already exists in database
-                    existing = self.session.query(SearchResult).filter_by(
-                        query_id=query.id,
-                        url=url
-                    ).first()
-
-                    if not existing:
-                        db_result = SearchResult(
-                            query_id=query.id,
-                            url=url,
-                            image_url=result.get('image_url', ''),
-                            page_url=result.get('source_url', ''),
-                            title=result.get('title', ''),
-                            snippet='',
-                            position=result.get('position', 0),
-                            source_domain=result.get('source_domain', '')
+                    unique_results.setdefault(result.get('source_url', ''), result)
+
+                # One round-trip for the URLs already stored for this query, loading
+                # only the columns the later steps read
+                existing = {
+                    r.url: r for r in await self.session.scalars(
+                        select(SearchResult)
+                        .options(load_only(
+                            SearchResult.id, SearchResult.url,
+                            SearchResult.image_url, SearchResult.page_url
+                        ))
+                        .where(
+                            SearchResult.query_id == query.id,
+                            SearchResult.url.in_(list(unique_results))
                         )
-                        self.session.add(db_result)
-                        db_results.append(db_result)
-                    else:
-                        db_results.append(existing)
+                    )
+                }
+
+                new_rows = [
+                    {
+                        'query_id': query.id,
+                        'url': url,
+                        'image_url': result.get('image_url', ''),
+                        'page_url': result.get('source_url', ''),
+                        'title': result.get('title', ''),
+                        'snippet': '',
+                        'position': result.get('position', 0),
+                        'source_domain': result.get('source_domain', '')
+                    }
+                    for url, result in unique_results.items()
+                    if url not in existing
+                ]
 
-                self.session.commit()
-                print(f"   Stored {len(db_results)} results")
+                # One multi-row INSERT, returning the new rows as ORM objects
+                if new_rows:
+                    inserted = await self.session.scalars(
+                        pg_insert(SearchResult)
+                        .values(new_rows)
+                        .on_conflict_do_nothing(index_elements=['query_id', 'url'])
+                        .returning(SearchResult)
+                    )
+                    existing.update((r.url, r) for r in inserted)
 
-                # 3. Capture screenshots
-                print("\n3️⃣ Capturing screenshots...")
-                image_urls = [r.get('image_url') for r in search_results[:10] if r.get('image_url')]
+                db_results = [existing[url] for url in unique_results if url in existing]
 
-                if image_urls:
-                    gallery_screenshot = await self.screenshot_capture.capture_image_gallery(
-                        image_urls, query.search_term
-                    )
+                print(f"   Stored {len(db_results)} results")
 
-                    if gallery_screenshot:
-                        # Store screenshot in database
-                        for db_result in db_results[:10]:
-                            screenshot = Screenshot(
-                                result_id=db_result.id,
-                                file_path=gallery_screenshot,
-                                file_name=Path(gallery_screenshot).name,
-                                screenshot_type='gallery',
-                                page_url=db_result.page_url
-                            )
-                            self.session.add(screenshot)
-                            db_result.screenshot_status = 'completed'
-
-                        self.session.commit()
-                        total_screenshots += 1
-                        print(f"   Gallery screenshot captured")
-
-                # 4. Download images
+                # 3. Capture screenshots and 4. download images concurrently
+                print("\n3️⃣ Capturing screenshots...")
                 print("\n4️⃣ Downloading images...")
-                images_to_download = [
-                    (r.get('image_url'), query.category)
-                    for r in search_results[:10]
-                    if r.get('image_url')
-                ]
-
-                downloaded_images = await self.image_downloader.download_images_batch(
-                    images_to_download,
-                    max_concurrent=3
+                # One pass over the first 10 results feeds both the gallery and the downloads
+                image_urls = [url for url in (r.get('image_url') for r in search_results[:10]) if url]
+                images_to_download = [(url, query.category) for url in image_urls]
+
+                gallery_screenshot, downloaded_images = await asyncio.gather(
+                    self._capture_gallery(image_urls, query.search_term),
+                    self.image_downloader.download_images_batch(
+                        images_to_download,
+                        max_concurrent=10
+                    )
                 )
 
+                if gallery_screenshot:
+                    # Store screenshot in database
+                    file_name = Path(gallery_screenshot).name
+                    await self.session.execute(insert(Screenshot), [
+                        {
+                            'result_id': db_result.id,
+                            'file_path': gallery_screenshot,
+                            'file_name': file_name,
+                            'screenshot_type': 'gallery',
+                            'page_url': db_result.page_url
+                        }
+                        for db_result in db_results[:10]
+                    ])
+                    await self.session.execute(
+                        update(SearchResult)
+                        .where(SearchResult.id.in_([r.id for r in db_results[:10]]))
+                        .values(screenshot_status='completed')
+                        .execution_options(synchronize_session=False)
+                    )
+                    total_screenshots += 1
+                    print(f"   Gallery screenshot captured")
+
                 print(f"   Downloaded {len(downloaded_images)} images")
 
-                # Store downloaded images in database
+                # Store downloaded images in database, matched to the first result with that URL
+                by_url = {r.image_url: r for r in reversed(db_results) if r.image_url}
+
+                captured_rows = []
                 for img_data in downloaded_images:
-                    # Find corresponding search result
-                    for db_result in db_results:
-                        if db_result.image_url == img_data['download_url']:
-                            captured_img = CapturedImage(
-                                result_id=db_result.id,
-                                file_path=img_data['file_path'],
-                                file_name=img_data['file_name'],
-                                file_size=img_data['file_size'],
-                                image_width=img_data['image_width'],
-                                image_height=img_data['image_height'],
-                                image_format=img_data['image_format'],
-                                download_url=img_data['download_url'],
-                                exif_data=img_data.get('exif_data'),
-                                location_data=img_data.get('location_data')
-                            )
-                            self.session.add(captured_img)
-                            db_result.image_download_status = 'completed'
-                            break
-
-                self.session.commit()
-                total_images_captured += len(downloaded_images)
+                    db_result = by_url.get(img_data['download_url'])
+                    if db_result:
+                        captured_rows.append({
+                            'result_id': db_result.id,
+                            'file_path': img_data['file_path'],
+                            'file_name': img_data['file_name'],
+                            'file_size': img_data['file_size'],
+                            'image_width': img_data['image_width'],
+                            'image_height': img_data['image_height'],
+                            'image_format': img_data['image_format'],
+                            'download_url': img_data['download_url'],
+                            'thumbnail_b64': img_data.get('thumbnail_b64'),
+                            'exif_data': img_data.get('exif_data'),
+                            'location_data': img_data.get('location_data')
+                        })
+
+                if captured_rows:
+                    await self.session.execute(insert(CapturedImage), captured_rows)
+                    await self.session.execute(
+                        update(SearchResult)
+                        .where(SearchResult.id.in_([row['result_id'] for row in captured_rows]))
+                        .values(image_download_status='completed')
+                        .execution_options(synchronize_session=False)
+                    )
 
-                # 5. Analyze images with Ollama
-                if self.analyzer and downloaded_images:
-                    print("\n5️⃣ Analyzing images with local LLM...")
-                    image_paths = [img['file_path'] for img in downloaded_images[:5]]  # Limit to 5 for speed
-
-                    analyses = self.analyzer.batch_analyze(image_paths)
-
-                    # Create a mapping of image paths to their analyses
-                    analysis_by_path = {}
-                    for i, analysis in enumerate(analyses):
-                        if i < len(image_paths):
-                            analysis_by_path[image_paths[i]] = analysis
-
-                    # Track which result_ids we've already processed to avoid duplicates
-                    processed_result_ids = set()
-
-                    for img_path, analysis in analysis_by_path.items():
-                        # Find the specific captured image and its result
-                        captured = self.session.query(CapturedImage).filter_by(
-                            file_path=img_path
-                        ).first()
-
-                        if captured and captured.result_id not in processed_result_ids:
-                            # Check if ContentAnalysis already exists for this result
-                            existing_analysis = self.session.query(ContentAnalysis).filter_by(
-                                result_id=captured.result_id
-                            ).first()
-
-                            if not existing_analysis:
-                                content_analysis = ContentAnalysis(
-                                    result_id=captured.result_id,
-                                    scene_description=analysis.get('scene_description', ''),
-                                    location_assessment=analysis.get('location_assessment', ''),
-                                    environment_type=analysis.get('environment_type', 'unknown'),
-                                    personnel_count=analysis.get('personnel_count', 0),
-                                    personnel_types=analysis.get('personnel_types', []),
-                                    uniform_identification=analysis.get('uniform_identification', ''),
-                                    activity_type=analysis.get('activity_type', 'unknown'),
-                                    activity_description=analysis.get('activity_description', ''),
-                                    concern_level=analysis.get('concern_level', 'low'),
-                                    concern_indicators=analysis.get('concern_indicators', []),
-                                    supervision_present=analysis.get('supervision_present', False),
-                                    restriction_indicators=analysis.get('restriction_indicators', []),
-                                    analysis_model=analysis.get('analysis_model', ''),
-                                    confidence_score=analysis.get('confidence_score', 0.0),
-                                    processing_time=analysis.get('processing_time', 0.0)
-                                )
-                                self.session.add(content_analysis)
-                                
-                                # Mark the search result as analyzed
-                                db_result = self.session.query(SearchResult).filter_by(
-                                    id=captured.result_id
-                                ).first()
-                                if db_result:
-                                    db_result.analysis_status = 'completed'
-                                
-                                processed_result_ids.add(captured.result_id)
-                            else:
-                                # Analysis already exists, just update status
-                                db_result = self.session.query(SearchResult).filter_by(
-                                    id=captured.result_id
-                                ).first()
-                                if db_result:
-                                    db_result.analysis_status = 'completed'
-
-                    self.session.commit()
-                    total_analyses += len(processed_result_ids)
-                    print(f"   Analyzed {len(analyses)} images")
+                total_images_captured += len(downloaded_images)
 
                 # Update session statistics
                 search_session.total_results += len(db_results)
                 search_session.images_captured += len(downloaded_images)
                 search_session.screenshots_taken += 1 if gallery_screenshot else 0
-                search_session.analyses_completed += len(analyses) if self.analyzer else 0
-                self.session.commit()
 
-                # Rate limiting
-                if idx < total_queries:
-                    await asyncio.sleep(2)
+                # One commit for everything this query stored
+                await self.session.commit()
+
+                # 5. Hand images to the background analysis worker once their rows are committed
+                if self.analyzer and downloaded_images:
+                    print("\n5️⃣ Queueing images for local LLM analysis...")
+                    # Limit to 5 for speed
+                    await analysis_queue.put([img['file_path'] for img in downloaded_images[:5]])
+
+            # Surface any search error raised by the prefetch task
+            await prefetch
+
+            # Wait for queued analyses to be stored
+            if analysis_worker:
+                await analysis_queue.join()
+                analysis_worker.cancel()
 
             # Finalize session
             search_session.completed_at = datetime.now()
             search_session.current_status = 'completed'
-            self.session.commit()
+            await self.session.commit()
 
             # Print summary
             print("\n" + "=" * 60)
@@ -286,7 +409,7 @@ class DPRKImagePipeline:
             print(f"✓ Queries processed: {total_queries}")
             print(f"✓ Images captured: {total_images_captured}")
             print(f"✓ Screenshots taken: {total_screenshots}")
-            print(f"✓ Analyses completed: {total_analyses}")
+            print(f"✓ Analyses completed: {self.total_analyses}")
 
             # Get storage statistics
             stats = self.image_downloader.get_storage_statistics()
@@ -303,7 +426,8 @@ class DPRKImagePipeline:
         finally:
             # Cleanup
             await self.screenshot_capture.close()
-            self.session.close()
+            await self.image_downloader.close()
+            await self.session.close()
 
     async def run_test(self):
         """Run a test with limited queries"""
@@ -5,64 +5,228 @@ import sys
 import os
 import asyncio
 import argparse
+import time
 from datetime import datetime
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
 
 # Add project root to path
 sys.path.append(str(Path(__file__).parent))
 
-from database.connection import get_session
+from database.connection import get_scoped_session, async_engine
 from database.article_models import ArticleSearch, ArticleResult, ArticleContent, ArticleAnalysis
 from sqlalchemy import text
-from scripts.article.process_article_searches import ArticleSearchProcessor
-from scripts.article.process_article_content import ArticleContentProcessor
-from scripts.article.process_article_analysis import ArticleAnalysisProcessor
+from search_terms.dprk_images_search_terms_3 import search_packs
+
+# Every (category, term) pair in search pack order, flattened once at import
+ALL_TERMS = tuple(
+    (category, term) for category, terms in search_packs.items() for term in terms
+)
+
+# Seconds a downstream stage waits between passes over newly pending rows
+STAGE_POLL_INTERVAL = 15
+
+# Seconds a computed pipeline status is reused before the counts are re-run
+STATUS_CACHE_TTL = 30
+
+# Connection pool shared by every HTTP-using phase. Scrapes all go to the Firecrawl
+# API over HTTP/2, so they multiplex on a few connections below this cap
+HTTP_CONNECTION_LIMIT = 100
+HTTP_KEEPALIVE_TIMEOUT = 30
+
+
+def write_lines(*lines):
+    """Emit a block of output lines with a single stdout write instead of a print per line"""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+# Report queries, built once at import rather than on every call
+
+# Status counts run in read-only transactions, so mid-run status checks never take
+# write locks alongside the phases inserting content and analyses
+_STATUS_ENGINE = async_engine.execution_options(postgresql_readonly=True)
+
+# Keys of the dict returned by get_pipeline_status
+STATUS_KEYS = (
+    'searches', 'results', 'content', 'successful_content',
+    'analyses', 'successful_analyses', 'high_priority'
+)
+
+# Independent per-table counts; a joined COUNT(DISTINCT) fans out across every stage.
+# Each table is read once, FILTER giving its subset counts, and the queries run
+# concurrently on separate connections. Columns are named after the status keys
+_STATUS_SQL = (
+    text("SELECT COUNT(*) as searches FROM article_searches"),
+    text("SELECT COUNT(*) as results FROM article_results"),
+    text("""
+        SELECT COUNT(*) as content,
+               COUNT(*) FILTER (WHERE scrape_success) as successful_content
+        FROM article_content
+    """),
+    text("""
+        SELECT COUNT(*) as analyses,
+               COUNT(*) FILTER (WHERE error_message IS NULL) as successful_analyses,
+               COUNT(*) FILTER (WHERE concern_level IN ('high', 'critical')) as high_priority
+        FROM article_analysis
+    """),
+)
+
+# Every other article table references article_searches through a non-null foreign
+# key chain, so no searches means every count is zero. An EXISTS probe stops at the
+# first row, where pg_class.reltuples could still read 0 or -1 before ANALYZE
+_HAS_SEARCHES_SQL = text("SELECT EXISTS (SELECT 1 FROM article_searches)")
+
+# Reads ix_article_analysis_priority_score in order: same partial predicate, and
+# priority_score > 0 is exactly concern_level 'high' or 'critical'
+_CONCERNING_SQL = text("""
+    SELECT ar.title, aa.concern_level, aa.summary, ar.url, ar.source_domain
+    FROM article_analysis aa
+    JOIN article_results ar ON aa.result_id = ar.id
+    WHERE aa.error_message IS NULL
+    AND aa.priority_score > 0
+    ORDER BY aa.priority_score DESC
+    LIMIT 10
+""")
+
+# Search category statistics: each stage is counted per search through
+# correlated subqueries, then summed, so no four-way join fan-out
+_CATEGORY_SQL = text("""
+    SELECT as_table.category,
+           COUNT(*) as searches,
+           SUM(per_search.results)::bigint as results,
+           SUM(per_search.content)::bigint as content,
+           SUM(per_search.analyses)::bigint as analyses
+    FROM article_searches as_table
+    CROSS JOIN LATERAL (
+        SELECT
+            (SELECT COUNT(*) FROM article_results ar
+             WHERE ar.search_id = as_table.id) as results,
+            (SELECT COUNT(*) FROM article_content ac
+             JOIN article_results ar ON ac.result_id = ar.id
+             WHERE ar.search_id = as_table.id
+             AND ac.scrape_success) as content,
+            (SELECT COUNT(*) FROM article_analysis aa
+             JOIN article_results ar ON aa.result_id = ar.id
+             WHERE ar.search_id = as_table.id
+             AND aa.error_message IS NULL) as analyses
+    ) per_search
+    GROUP BY as_table.category
+    ORDER BY analyses DESC
+""").execution_options(stream_results=True)
 
 
 class ArticlePipelineOrchestrator:
     """Orchestrate the complete article processing pipeline"""
 
     def __init__(self):
-        self.session = get_session()
+        # Thread-local: the processors built on this thread reuse this session,
+        # while the search phase's worker thread gets its own
+        self.session = get_scoped_session()
         self.start_time = datetime.now()
+        self._status_cache = None  # (monotonic timestamp, status dict)
+
+    @staticmethod
+    def _http_session():
+        """Open the HTTP session shared by the phases of one pipeline run"""
+        import httpx
+
+        return httpx.AsyncClient(http2=True, limits=httpx.Limits(
+            max_connections=HTTP_CONNECTION_LIMIT,
+            max_keepalive_connections=HTTP_CONNECTION_LIMIT,
+            keepalive_expiry=HTTP_KEEPALIVE_TIMEOUT
+        ))
 
     def get_pipeline_status(self):
         """Get current status of the article processing pipeline"""
 
-        # Get statistics for each stage
-        stats = self.session.execute(text("""
-            SELECT
-                COUNT(DISTINCT as_table.id) as total_searches,
-                COUNT(DISTINCT ar.id) as total_results,
-                COUNT(DISTINCT ac.id) as total_content,
-                COUNT(DISTINCT aa.id) as total_analyses,
-                COUNT(CASE WHEN ac.scrape_success = true THEN 1 END) as successful_content,
-                COUNT(CASE WHEN aa.id IS NOT NULL THEN 1 END) as successful_analyses
-            FROM article_searches as_table
-            LEFT JOIN article_results ar ON as_table.id = ar.search_id
-            LEFT JOIN article_content ac ON ar.id = ac.result_id
-            LEFT JOIN article_analysis aa ON ar.id = aa.result_id
-        """)).fetchone()
-
-        # Get high-priority content count
-        high_priority = self.session.execute(text("""
-            SELECT COUNT(*) as count
-            FROM article_analysis
-            WHERE concern_level IN ('high', 'critical')
-        """)).scalar()
-
-        return {
-            'searches': stats.total_searches or 0,
-            'results': stats.total_results or 0,
-            'content': stats.total_content or 0,
-            'successful_content': stats.successful_content or 0,
-            'analyses': stats.total_analyses or 0,
-            'successful_analyses': stats.successful_analyses or 0,
-            'high_priority': high_priority or 0
-        }
+        if self._status_cache and time.monotonic() - self._status_cache[0] < STATUS_CACHE_TTL:
+            return self._status_cache[1]
+
+        async def run_once():
+            try:
+                return await self.get_pipeline_status_async()
+            finally:
+                # Pooled asyncpg connections belong to this throwaway event loop
+                await async_engine.dispose()
+
+        return asyncio.run(run_once())
+
+    async def get_pipeline_status_async(self):
+        """Get current status of the pipeline, running the per-table counts concurrently"""
+
+        if self._status_cache and time.monotonic() - self._status_cache[0] < STATUS_CACHE_TTL:
+            return self._status_cache[1]
+
+        async with _STATUS_ENGINE.connect() as conn:
+            has_searches = (await conn.execute(_HAS_SEARCHES_SQL)).scalar()
+        if not has_searches:
+            status = dict.fromkeys(STATUS_KEYS, 0)
+            self._status_cache = (time.monotonic(), status)
+            return status
+
+        async def count(query):
+            async with _STATUS_ENGINE.connect() as conn:
+                return (await conn.execute(query)).one()._mapping
+
+        status = {}
+        for counts in await asyncio.gather(*(count(query) for query in _STATUS_SQL)):
+            status.update((key, value or 0) for key, value in counts.items())
+
+        self._status_cache = (time.monotonic(), status)
+        return status
+
+    def invalidate_status(self):
+        """Drop the cached status after a phase has changed the underlying tables"""
+        self._status_cache = None
+
+    def _run_searches(self, search_limit, results_per_query):
+        """Run the search phase; blocking, so the pipeline calls it from a worker thread"""
+        from scripts.article.process_article_searches import ArticleSearchProcessor
+
+        search_processor = ArticleSearchProcessor(session=get_scoped_session())
+
+        if search_limit:
+            # Process specific number of searches
+            limited_terms = ALL_TERMS[:search_limit]
+            # ALL_TERMS is already grouped by category, so one call per category
+            for category, group in groupby(limited_terms, key=itemgetter(0)):
+                search_processor._process_category(
+                    category, [term for _, term in group], results_per_query
+                )
+        else:
+            # Process all searches
+            search_processor.process_all_searches(results_per_query)
+
+    async def _drain_stage(self, upstream_done: asyncio.Event, run_round, processed, limit):
+        """
+        Re-run a stage over whatever is pending until its upstream stage has finished
+
+        Failed items are stored with an error row, so later rounds never pick them up again.
+        """
+        while True:
+            finished = upstream_done.is_set()
+
+            if limit:
+                remaining = limit - processed()
+                if remaining <= 0:
+                    return
+                await run_round(remaining)
+            else:
+                await run_round(None)
+
+            if finished:
+                return
+
+            # Wait for more upstream work, or for the upstream stage to finish
+            try:
+                await asyncio.wait_for(upstream_done.wait(), STAGE_POLL_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
 
     async def run_full_pipeline(self, search_limit=None, content_limit=None, analysis_limit=None,
-                              results_per_query=50, content_batch_size=50, analysis_max_concurrent=3):
+                              results_per_query=50, content_batch_size=50,
+                              analysis_max_concurrent=None, analysis_max_rps=None):
         """
         Run the complete article processing pipeline
 
@@ -72,91 +236,114 @@ class ArticlePipelineOrchestrator:
             analysis_limit: Limit articles to analyze
             results_per_query: Results per search query
             content_batch_size: Concurrent content scraping
-            analysis_max_concurrent: Concurrent analysis tasks
+            analysis_max_concurrent: Concurrent analysis tasks (processor default if None)
+            analysis_max_rps: Analysis requests started per second (unlimited if None)
         """
-
-        print("=" * 80)
-        print("DPRK ARTICLE PROCESSING PIPELINE")
-        print("=" * 80)
-        print(f"🚀 Starting full pipeline at {self.start_time.strftime('%Y-%m-%d %H:%M:%S')}")
+        # Processor modules pull in the HTTP and model clients; --status and
+        # --report never need them, so they are only imported once a run starts
+        from scripts.article.process_article_content import ArticleContentProcessor
+        from scripts.article.process_article_analysis import (
+            ArticleAnalysisProcessor, DEFAULT_MAX_CONCURRENT
+        )
 
         # Initial status
-        initial_status = self.get_pipeline_status()
-        print(f"\n📊 Initial Status:")
-        self._print_status(initial_status)
+        initial_status = await self.get_pipeline_status_async()
+        write_lines(
+            "=" * 80,
+            "DPRK ARTICLE PROCESSING PIPELINE",
+            "=" * 80,
+            f"🚀 Starting full pipeline at {self.start_time.strftime('%Y-%m-%d %H:%M:%S')}",
+            f"\n📊 Initial Status:",
+            *self._status_lines(initial_status)
+        )
 
         total_phases = 3
         current_phase = 0
 
         try:
-            # Phase 1: Search Processing
-            current_phase += 1
-            print(f"\n{'='*60}")
-            print(f"📋 PHASE {current_phase}/{total_phases}: SEARCH PROCESSING")
-            print(f"{'='*60}")
-
-            search_processor = ArticleSearchProcessor()
-
-            if search_limit:
-                # Process specific number of searches
-                from search_terms.dprk_images_search_terms_3 import search_packs
-                all_terms = []
-                for category, terms in search_packs.items():
-                    all_terms.extend([(category, term) for term in terms])
-
-                limited_terms = all_terms[:search_limit]
-                for category, term in limited_terms:
-                    search_processor._process_category(category, [term], results_per_query)
-            else:
-                # Process all searches
-                search_processor.process_all_searches(results_per_query)
-
-            # Phase 2: Content Scraping
-            current_phase += 1
-            print(f"\n{'='*60}")
-            print(f"🔍 PHASE {current_phase}/{total_phases}: CONTENT SCRAPING")
-            print(f"{'='*60}")
-
-            content_processor = ArticleContentProcessor()
-            await content_processor.process_pending_articles(
-                limit=content_limit,
-                batch_size=content_batch_size
-            )
+            # The three phases run as a pipeline: content scraping picks up results as
+            # searches store them, and analysis picks up content as it is scraped
+            search_done = asyncio.Event()
+            content_done = asyncio.Event()
+
+            def start_phase(icon, title):
+                nonlocal current_phase
+                current_phase += 1
+                write_lines(
+                    f"\n{'='*60}",
+                    f"{icon} PHASE {current_phase}/{total_phases}: {title}",
+                    f"{'='*60}"
+                )
 
-            # Phase 3: Content Analysis
-            current_phase += 1
-            print(f"\n{'='*60}")
-            print(f"🤖 PHASE {current_phase}/{total_phases}: CONTENT ANALYSIS")
-            print(f"{'='*60}")
+            async def search_phase():
+                # Phase 1: Search Processing (blocking SERP client, so off the event loop)
+                start_phase("📋", "SEARCH PROCESSING")
+                try:
+                    await asyncio.to_thread(self._run_searches, search_limit, results_per_query)
+                finally:
+                    search_done.set()
+
+            async def content_phase():
+                # Phase 2: Content Scraping
+                start_phase("🔍", "CONTENT SCRAPING")
+                try:
+                    content_processor = ArticleContentProcessor(
+                        session=get_scoped_session(), http=http
+                    )
+                    await self._drain_stage(
+                        search_done,
+                        lambda limit: content_processor.process_pending_articles(
+                            limit=limit,
+                            batch_size=content_batch_size
+                        ),
+                        lambda: content_processor.processed_count,
+                        content_limit
+                    )
+                finally:
+                    content_done.set()
+
+            async def analysis_phase():
+                # Phase 3: Content Analysis
+                start_phase("🤖", "CONTENT ANALYSIS")
+                analysis_processor = ArticleAnalysisProcessor(session=get_scoped_session())
+                await self._drain_stage(
+                    content_done,
+                    lambda limit: analysis_processor.process_pending_analysis(
+                        limit=limit,
+                        max_concurrent=analysis_max_concurrent or DEFAULT_MAX_CONCURRENT,
+                        max_rps=analysis_max_rps
+                    ),
+                    lambda: analysis_processor.processed_count,
+                    analysis_limit
+                )
 
-            analysis_processor = ArticleAnalysisProcessor()
-            await analysis_processor.process_pending_analysis(
-                limit=analysis_limit,
-                max_concurrent=analysis_max_concurrent
-            )
+            async with self._http_session() as http:
+                await asyncio.gather(search_phase(), content_phase(), analysis_phase())
+            self.invalidate_status()
 
             # Final status and summary
-            final_status = self.get_pipeline_status()
+            final_status = await self.get_pipeline_status_async()
             duration = datetime.now() - self.start_time
 
-            print(f"\n{'='*80}")
-            print("✅ PIPELINE COMPLETED SUCCESSFULLY")
-            print(f"{'='*80}")
-            print(f"⏱️  Total duration: {duration}")
-            print(f"\n📊 Final Status:")
-            self._print_status(final_status)
-
-            print(f"\n📈 Progress Summary:")
-            print(f"   Searches processed: {final_status['searches'] - initial_status['searches']}")
-            print(f"   Results collected: {final_status['results'] - initial_status['results']}")
-            print(f"   Content extracted: {final_status['successful_content'] - initial_status['successful_content']}")
-            print(f"   Articles analyzed: {final_status['successful_analyses'] - initial_status['successful_analyses']}")
-            print(f"   High-priority found: {final_status['high_priority'] - initial_status['high_priority']}")
+            write_lines(
+                f"\n{'='*80}",
+                "✅ PIPELINE COMPLETED SUCCESSFULLY",
+                f"{'='*80}",
+                f"⏱️  Total duration: {duration}",
+                f"\n📊 Final Status:",
+                *self._status_lines(final_status),
+                f"\n📈 Progress Summary:",
+                f"   Searches processed: {final_status['searches'] - initial_status['searches']}",
+                f"   Results collected: {final_status['results'] - initial_status['results']}",
+                f"   Content extracted: {final_status['successful_content'] - initial_status['successful_content']}",
+                f"   Articles analyzed: {final_status['successful_analyses'] - initial_status['successful_analyses']}",
+                f"   High-priority found: {final_status['high_priority'] - initial_status['high_priority']}"
+            )
 
             return final_status
 
         except Exception as e:
-            print(f"\n❌ Pipeline failed at phase {current_phase}: {e}")
+            print(f"\n❌ Pipeline failed after starting {current_phase}/{total_phases} phases: {e}")
             import traceback
             traceback.print_exc()
             raise
@@ -176,9 +363,10 @@ class ArticlePipelineOrchestrator:
         print(f"🎯 Running specific phase: {phase.upper()}")
 
         if phase == 'search':
-            processor = ArticleSearchProcessor()
+            from scripts.article.process_article_searches import ArticleSearchProcessor
+
+            processor = ArticleSearchProcessor(session=get_scoped_session())
             if kwargs.get('category'):
-                from search_terms.dprk_images_search_terms_3 import search_packs
                 if kwargs['category'] in search_packs:
                     processor._process_category(
                         kwargs['category'],
@@ -191,43 +379,56 @@ class ArticlePipelineOrchestrator:
             else:
                 processor.process_all_searches(kwargs.get('results_per_query', 50))
 
-        elif phase == 'content':
-            async def run_content():
-                processor = ArticleContentProcessor()
+        elif phase in ('content', 'analysis'):
+            # One event loop for the async phases, created once per invocation
+            asyncio.run(self._dispatch_async_phase(phase, kwargs))
+
+        else:
+            write_lines(f"❌ Unknown phase: {phase}", "Valid phases: search, content, analysis")
+
+    async def _dispatch_async_phase(self, phase: str, kwargs: dict):
+        """Run the content or analysis phase inside the caller's event loop"""
+        if phase == 'content':
+            from scripts.article.process_article_content import ArticleContentProcessor
+
+            async with self._http_session() as http:
+                processor = ArticleContentProcessor(session=get_scoped_session(), http=http)
                 await processor.process_pending_articles(
                     limit=kwargs.get('limit'),
                     batch_size=kwargs.get('batch_size', 10)
                 )
-            asyncio.run(run_content())
 
         elif phase == 'analysis':
-            async def run_analysis():
-                processor = ArticleAnalysisProcessor()
-                await processor.process_pending_analysis(
-                    limit=kwargs.get('limit'),
-                    max_concurrent=kwargs.get('max_concurrent', 3)
-                )
-            asyncio.run(run_analysis())
+            from scripts.article.process_article_analysis import (
+                ArticleAnalysisProcessor, DEFAULT_MAX_CONCURRENT
+            )
 
-        else:
-            print(f"❌ Unknown phase: {phase}")
-            print("Valid phases: search, content, analysis")
+            processor = ArticleAnalysisProcessor(session=get_scoped_session())
+            await processor.process_pending_analysis(
+                limit=kwargs.get('limit'),
+                max_concurrent=kwargs.get('max_concurrent') or DEFAULT_MAX_CONCURRENT,
+                max_rps=kwargs.get('max_rps')
+            )
 
-    def _print_status(self, status):
-        """Print pipeline status in formatted way"""
-        print(f"   🔍 Searches executed: {status['searches']}")
-        print(f"   📄 Results collected: {status['results']}")
-        print(f"   📝 Content extracted: {status['successful_content']}/{status['content']}")
-        print(f"   🤖 Articles analyzed: {status['successful_analyses']}/{status['analyses']}")
-        print(f"   🚨 High-priority articles: {status['high_priority']}")
+    def _status_lines(self, status):
+        """Format pipeline status as output lines"""
+        lines = [
+            f"   🔍 Searches executed: {status['searches']}",
+            f"   📄 Results collected: {status['results']}",
+            f"   📝 Content extracted: {status['successful_content']}/{status['content']}",
+            f"   🤖 Articles analyzed: {status['successful_analyses']}/{status['analyses']}",
+            f"   🚨 High-priority articles: {status['high_priority']}",
+        ]
 
         if status['results'] > 0:
             content_rate = status['successful_content'] / status['results'] * 100
-            print(f"   📈 Content extraction rate: {content_rate:.1f}%")
+            lines.append(f"   📈 Content extraction rate: {content_rate:.1f}%")
 
         if status['successful_content'] > 0:
             analysis_rate = status['successful_analyses'] / status['successful_content'] * 100
-            print(f"   📈 Analysis completion rate: {analysis_rate:.1f}%")
+            lines.append(f"   📈 Analysis completion rate: {analysis_rate:.1f}%")
+
+        return lines
 
     def generate_summary_report(self):
         """Generate comprehensive pipeline summary"""
@@ -235,65 +436,38 @@ class ArticlePipelineOrchestrator:
         status = self.get_pipeline_status()
 
         # Get top concerning articles
-        concerning_articles = self.session.execute(text("""
-            SELECT ac.title, aa.concern_level, aa.dprk_relevance,
-                   aa.summary, ar.url, ar.source_domain
-            FROM article_analysis aa
-            JOIN article_content ac ON aa.content_id = ac.id
-            JOIN article_results ar ON ac.result_id = ar.id
-            WHERE aa.analysis_status = 'success'
-            AND aa.concern_level IN ('high', 'critical')
-            ORDER BY
-                CASE aa.concern_level
-                    WHEN 'critical' THEN 3
-                    WHEN 'high' THEN 2
-                    ELSE 1
-                END DESC,
-                CASE aa.dprk_relevance
-                    WHEN 'high' THEN 3
-                    WHEN 'medium' THEN 2
-                    ELSE 1
-                END DESC
-            LIMIT 10
-        """)).fetchall()
-
-        # Get search category statistics
-        category_stats = self.session.execute(text("""
-            SELECT as_table.category,
-                   COUNT(DISTINCT as_table.id) as searches,
-                   COUNT(DISTINCT ar.id) as results,
-                   COUNT(DISTINCT CASE WHEN ac.scraping_status = 'success' THEN ac.id END) as content,
-                   COUNT(DISTINCT CASE WHEN aa.analysis_status = 'success' THEN aa.id END) as analyses
-            FROM article_searches as_table
-            LEFT JOIN article_results ar ON as_table.id = ar.search_id
-            LEFT JOIN article_content ac ON ar.id = ac.result_id
-            LEFT JOIN article_analysis aa ON ac.id = aa.content_id
-            GROUP BY as_table.category
-            ORDER BY analyses DESC
-        """)).fetchall()
-
-        print(f"\n{'='*80}")
-        print("📋 ARTICLE PIPELINE SUMMARY REPORT")
-        print(f"{'='*80}")
-        print(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-
-        print(f"\n📊 Overall Statistics:")
-        self._print_status(status)
-
-        print(f"\n📋 Results by Category:")
+        concerning_articles = self.session.execute(_CONCERNING_SQL).fetchall()
+
+        write_lines(
+            f"\n{'='*80}",
+            "📋 ARTICLE PIPELINE SUMMARY REPORT",
+            f"{'='*80}",
+            f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+            f"\n📊 Overall Statistics:",
+            *self._status_lines(status)
+        )
+
+        category_stats = self.session.execute(_CATEGORY_SQL)
+
+        lines = [f"\n📋 Results by Category:"]
         for category, searches, results, content, analyses in category_stats:
-            print(f"   {category}:")
-            print(f"     Searches: {searches}, Results: {results}")
-            print(f"     Content: {content}, Analyses: {analyses}")
+            lines += [
+                f"   {category}:",
+                f"     Searches: {searches}, Results: {results}",
+                f"     Content: {content}, Analyses: {analyses}",
+            ]
 
         if concerning_articles:
-            print(f"\n🚨 High-Priority Articles Found:")
-            for i, (title, level, relevance, summary, url, domain) in enumerate(concerning_articles, 1):
-                print(f"\n   {i}. [{level.upper()}] {title[:100]}...")
-                print(f"      DPRK Relevance: {relevance}")
-                print(f"      Source: {domain}")
-                print(f"      Summary: {summary[:200]}...")
-                print(f"      URL: {url[:100]}...")
+            lines.append(f"\n🚨 High-Priority Articles Found:")
+            for i, (title, level, summary, url, domain) in enumerate(concerning_articles, 1):
+                lines += [
+                    f"\n   {i}. [{level.upper()}] {(title or '')[:100]}...",
+                    f"      Source: {domain}",
+                    f"      Summary: {(summary or '')[:200]}...",
+                    f"      URL: {url[:100]}...",
+                ]
+
+        write_lines(*lines)
 
         return status
 
@@ -315,7 +489,7 @@ Examples:
   # Run specific phase
   python main_article_pipeline.py --phase search --results-per-query 30
   python main_article_pipeline.py --phase content --batch-size 50
-  python main_article_pipeline.py --phase analysis --max-concurrent 2
+  python main_article_pipeline.py --phase analysis --max-concurrent 8 --max-rps 4
 
   # Process specific category only
   python main_article_pipeline.py --phase search --category "Refugees_Communities"
@@ -355,18 +529,26 @@ Examples:
     # Analysis phase options
     parser.add_argument('--analysis-limit', type=int,
                        help='Limit number of articles to analyze')
-    parser.add_argument('--max-concurrent', type=int, default=3,
-                       help='Maximum concurrent analysis tasks')
+    parser.add_argument('--max-concurrent', type=int,
+                       help='Maximum concurrent analysis tasks (default: 16)')
+    parser.add_argument('--max-rps', type=float,
+                       help='Maximum analysis requests started per second')
 
     args = parser.parse_args()
 
+    # libuv-based event loop for the HTTP-heavy phases, when available
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     orchestrator = ArticlePipelineOrchestrator()
 
     try:
         if args.status:
             status = orchestrator.get_pipeline_status()
-            print("\n📊 Current Pipeline Status:")
-            orchestrator._print_status(status)
+            write_lines("\n📊 Current Pipeline Status:", *orchestrator._status_lines(status))
 
         elif args.report:
             orchestrator.generate_summary_report()
@@ -378,7 +560,8 @@ Examples:
                 analysis_limit=args.analysis_limit,
                 results_per_query=args.results_per_query,
                 content_batch_size=args.batch_size,
-                analysis_max_concurrent=args.max_concurrent
+                analysis_max_concurrent=args.max_concurrent,
+                analysis_max_rps=args.max_rps
             ))
 
         elif args.phase:
@@ -397,7 +580,8 @@ Examples:
             elif args.phase == 'analysis':
                 phase_kwargs.update({
                     'limit': args.analysis_limit,
-                    'max_concurrent': args.max_concurrent
+                    'max_concurrent': args.max_concurrent,
+                    'max_rps': args.max_rps
                 })
 
             orchestrator.run_specific_phase(args.phase, **phase_kwargs)
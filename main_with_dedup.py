@@ -2,12 +2,19 @@
 """Main pipeline for DPRK image capture with deduplication and theme tracking"""
 
 import asyncio
+import hashlib
+import re
 import sys
 import os
-from datetime import datetime
+import time
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from urllib.parse import urlsplit, urlunsplit
 from typing import List, Dict
 from dotenv import load_dotenv
+from sqlalchemy import select, insert, update, exists, func, or_
+from sqlalchemy.orm import load_only
+from pybloom_live import ScalableBloomFilter
 
 # Add project root to path
 sys.path.append(str(Path(__file__).parent))
@@ -21,10 +28,56 @@ from search.serp_image_client import SerpImageClient
 from capture.screenshot_capture import ScreenshotCapture
 from capture.image_downloader import ImageDownloader
 from utils.ollama_analyzer import OllamaAnalyzer
-from search_terms.dprk_images_search_terms_combined import search_terms_with_themes
+from search_terms.dprk_images_search_terms_combined import search_terms_with_themes, detect_language
 
 load_dotenv()
 
+# Bloom filter for previously captured image URLs: a few bytes per URL at this
+# error rate, instead of a full Python string per URL in a set. It starts at this
+# capacity and adds larger slices as the table grows, so loading never hits a cap
+EXISTING_URL_INITIAL_CAPACITY = 1_000_000
+EXISTING_URL_ERROR_RATE = 1e-4
+
+# The only SearchResult columns the capture, download and analysis steps read
+RESULT_FIELDS = (SearchResult.id, SearchResult.url, SearchResult.image_url)
+
+# Static image paths; their query strings are usually cache-busters or resize
+# hints, so they are dropped when comparing URLs
+IMAGE_PATH_RE = re.compile(r'\.(?:jpe?g|png|gif|webp|bmp)$', re.IGNORECASE)
+
+
+def canonical_image_url(url: str) -> str:
+    """Normalise an image URL for deduplication: lower-case scheme and host, no fragment,
+    and no query string when the path is a plain image file"""
+    if not url:
+        return url
+    parts = urlsplit(url)
+    query = '' if IMAGE_PATH_RE.search(parts.path) else parts.query
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, query, ''))
+
+
+def url_hash(url: str) -> int:
+    """64-bit blake2b hash of a URL; far smaller in a set than the string itself"""
+    return int.from_bytes(hashlib.blake2b(url.encode(), digest_size=8).digest(), 'little')
+
+# Minimum seconds between SERP searches
+SERP_MIN_INTERVAL = 1.0
+
+# SERP searches tried per query before giving up
+SERP_ATTEMPTS = 2
+
+# Queries that came back empty are not searched again for this long
+SERP_TTL = timedelta(days=7)
+
+# Browser pages open at once while capturing a query's screenshots
+SCREENSHOT_CONCURRENCY = 3
+
+# Queries processed per transaction; the per-query steps only flush
+COMMIT_EVERY = 20
+
+# Image downloads in flight at once; matches the downloader's connection pool limit
+DOWNLOAD_CONCURRENCY = 32
+
 class DPRKImagePipeline:
     """Main pipeline for image search, capture, and analysis with deduplication"""
 
@@ -34,22 +87,85 @@ class DPRKImagePipeline:
         self.image_downloader = ImageDownloader()
         self.analyzer = OllamaAnalyzer()
         self.session = get_session()
-        self.existing_image_urls = set()  # Cache for deduplication
+        # Image URLs captured before this run, and hashes of those seen during it
+        self.existing_image_urls = ScalableBloomFilter(
+            initial_capacity=EXISTING_URL_INITIAL_CAPACITY,
+            error_rate=EXISTING_URL_ERROR_RATE,
+            mode=ScalableBloomFilter.LARGE_SET_GROWTH
+        )
+        self.run_image_urls = set()
+        self._last_serp_ts = float('-inf')
         self.duplicate_count = 0
         self.new_image_count = 0
 
     def load_existing_image_urls(self):
         """Load all existing image URLs for deduplication"""
-        existing_images = self.session.query(CapturedImage.file_path, SearchResult.image_url).join(
-            SearchResult
-        ).all()
-
-        for _, image_url in existing_images:
-            if image_url:
-                self.existing_image_urls.add(image_url)
+        # Runs in a worker thread, so it uses its own session. Only the URL column,
+        # de-duplicated by the server and streamed; EXISTS keeps the "already captured"
+        # meaning without the join's extra column or a row per capture
+        with get_session() as session:
+            existing_images = session.query(SearchResult.image_url).filter(
+                SearchResult.image_url.isnot(None),
+                SearchResult.captured_images.any()
+            ).distinct().yield_per(10000)
+
+            for (image_url,) in existing_images:
+                self.existing_image_urls.add(canonical_image_url(image_url))
 
         print(f"📊 Loaded {len(self.existing_image_urls)} existing image URLs for deduplication")
 
+    def is_known_image(self, image_url: str) -> bool:
+        """Check whether an image URL was seen this run or captured before it"""
+        image_url = canonical_image_url(image_url)
+        if url_hash(image_url or '') in self.run_image_urls:
+            return True
+
+        if image_url and image_url in self.existing_image_urls:
+            # Bloom filter hits can be false positives; confirm before skipping.
+            # Stored URLs are raw, so narrow them by a case-insensitive prefix
+            # and compare canonical forms
+            candidates = self.session.scalars(select(SearchResult.image_url).where(
+                func.lower(SearchResult.image_url).startswith(image_url.lower(), autoescape=True),
+                SearchResult.captured_images.any()
+            ))
+            return any(canonical_image_url(url) == image_url for url in candidates)
+
+        return False
+
+    def needs_search(self, query: str) -> bool:
+        """Check whether a query has no stored results and no SERP search within SERP_TTL"""
+        cutoff = datetime.now(timezone.utc) - SERP_TTL
+        return not self.session.scalar(select(or_(
+            exists().where(
+                SearchResult.query_id == SearchQuery.id,
+                SearchQuery.search_term == query
+            ),
+            exists().where(
+                SearchQuery.search_term == query,
+                SearchQuery.last_searched_at >= cutoff
+            )
+        )))
+
+    async def _prefetch_serp(self, query: str):
+        """Fetch SERP results for a query that needs searching, honouring the rate limit"""
+        if not self.needs_search(query):
+            return None
+
+        # The blocking HTTP call runs in a worker thread; the session stays on the loop
+        for attempt in range(1, SERP_ATTEMPTS + 1):
+            wait = SERP_MIN_INTERVAL - (time.monotonic() - self._last_serp_ts)
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._last_serp_ts = time.monotonic()
+
+            try:
+                return await asyncio.to_thread(self.serp_client.search_images, query)
+            except Exception as e:
+                print(f"   ⚠️  Search attempt {attempt} failed for {query[:50]}: {e}")
+
+        # Not recorded as searched, so the next run tries again
+        return None
+
     async def run_pipeline(self, limit_queries: int = None, skip_analysis: bool = False):
         """
         Run the complete pipeline with deduplication
@@ -71,8 +187,11 @@ class DPRKImagePipeline:
                     return
                 print("✅ Ollama is ready")
 
-            # Load existing URLs for deduplication
-            self.load_existing_image_urls()
+            # Load existing URLs for deduplication in the background while the
+            # search session is created and the first SERP search runs
+            url_load = asyncio.get_running_loop().run_in_executor(
+                None, self.load_existing_image_urls
+            )
 
             # Create search session
             search_session = SearchSession(
@@ -80,18 +199,27 @@ class DPRKImagePipeline:
             )
             self.session.add(search_session)
             self.session.commit()
+            started = time.monotonic()
 
             # Process search terms with themes
             queries_to_process = search_terms_with_themes[:limit_queries] if limit_queries else search_terms_with_themes
 
             print(f"\n📋 Processing {len(queries_to_process)} search queries")
-            print(f"🔍 Deduplication enabled against {len(self.existing_image_urls)} existing images")
 
             total_results = 0
             total_captured = 0
             total_screenshots = 0
             total_analyzed = 0
 
+            # The next query's SERP search runs while the current query's screenshots
+            # and downloads are in flight
+            serp_task = asyncio.create_task(
+                self._prefetch_serp(queries_to_process[0]['term'])
+            ) if queries_to_process else None
+
+            await url_load
+            print(f"🔍 Deduplication enabled against {len(self.existing_image_urls)} existing images")
+
             for i, search_item in enumerate(queries_to_process, 1):
                 search_term = search_item['term']
                 theme = search_item['theme']
@@ -101,7 +229,16 @@ class DPRKImagePipeline:
                 print(f"   Theme: {theme} | Source: {source}")
 
                 # Search images
-                results = self.search_images(search_term, theme)
+                serp_results = await serp_task
+                results = self.search_images(
+                    search_term, theme, serp_results, search_item['language']
+                )
+
+                serp_task = None
+                if i < len(queries_to_process):
+                    serp_task = asyncio.create_task(
+                        self._prefetch_serp(queries_to_process[i]['term'])
+                    )
 
                 if results:
                     print(f"   Found {len(results)} results")
@@ -112,9 +249,9 @@ class DPRKImagePipeline:
                     skipped_duplicates = 0
 
                     for result in results:
-                        if result.image_url not in self.existing_image_urls:
+                        if not self.is_known_image(result.image_url):
                             new_results.append(result)
-                            self.existing_image_urls.add(result.image_url)  # Add to cache
+                            self.run_image_urls.add(url_hash(canonical_image_url(result.image_url) or ''))  # Add to cache
                         else:
                             skipped_duplicates += 1
                             self.duplicate_count += 1
@@ -143,8 +280,9 @@ class DPRKImagePipeline:
                 else:
                     print(f"   No results found")
 
-                # Small delay between queries
-                await asyncio.sleep(1)
+                # Commit in batches; the steps above only flush
+                if i % COMMIT_EVERY == 0:
+                    self.session.commit()
 
             # Update session stats
             search_session.completed_at = datetime.now()
@@ -162,9 +300,9 @@ class DPRKImagePipeline:
             print(f"💾 Images downloaded: {total_captured}")
             if not skip_analysis:
                 print(f"🤖 Images analyzed: {total_analyzed}")
-            if search_session.completed_at and search_session.started_at:
-                duration = (search_session.completed_at - search_session.started_at).total_seconds()
-                print(f"⏱️  Duration: {duration:.1f} seconds")
+            # Monotonic, and avoids reloading the expired session row after commit
+            duration = time.monotonic() - started
+            print(f"⏱️  Duration: {duration:.1f} seconds")
 
             return True
 
@@ -174,110 +312,132 @@ class DPRKImagePipeline:
             traceback.print_exc()
             return False
         finally:
+            # Keep whatever the last partial batch completed
+            try:
+                self.session.commit()
+            except Exception:
+                self.session.rollback()
             self.session.close()
             await self.screenshot_capture.close()
+            await self.image_downloader.close()
 
-    def search_images(self, query: str, theme: str) -> List[SearchResult]:
-        """Search for images and store results with theme"""
+    def search_images(self, query: str, theme: str, serp_results: List[Dict] = None,
+                      language: str = None) -> List[SearchResult]:
+        """Store prefetched SERP results with theme, or return the query's stored results"""
+        # Savepoints keep a failure here from discarding the rest of the uncommitted batch
         try:
-            # Check if query already exists
-            existing_query = self.session.query(SearchQuery).filter_by(
-                search_term=query
-            ).first()
-
-            if not existing_query:
-                # Create search query record with theme
-                search_query = SearchQuery(
-                    search_term=query,
-                    theme=theme  # Store the theme
-                )
+            with self.session.begin_nested():
+                # Check if query already exists
+                existing_query = self.session.query(SearchQuery).filter_by(
+                    search_term=query
+                ).first()
+
+                if not existing_query:
+                    # Create search query record with theme
+                    search_query = SearchQuery(
+                        search_term=query,
+                        theme=theme  # Store the theme
+                    )
 
-                # Detect language
-                if any(ord(c) > 0x3000 for c in query[:20]):
-                    if any(0xAC00 <= ord(c) <= 0xD7AF for c in query[:20]):
-                        search_query.language = 'ko'
-                    elif any(0x4E00 <= ord(c) <= 0x9FFF for c in query[:20]):
-                        search_query.language = 'zh'
-                elif any(0x0400 <= ord(c) <= 0x04FF for c in query[:20]):
-                    search_query.language = 'ru'
-                elif 'nord-coréen' in query.lower():
-                    search_query.language = 'fr'
-                else:
-                    search_query.language = 'en'
+                    # Language is precomputed for the bundled search terms
+                    search_query.language = language or detect_language(query)
 
-                self.session.add(search_query)
-                self.session.commit()
+                    self.session.add(search_query)
+                    self.session.flush()
+                else:
+                    # Update theme if different
+                    search_query = existing_query
+                    if search_query.theme != theme:
+                        search_query.theme = theme
                 query_id = search_query.id
-            else:
-                # Update theme if different
-                if existing_query.theme != theme:
-                    existing_query.theme = theme
-                    self.session.commit()
-                query_id = existing_query.id
-
-            # Check if we already have results for this query
-            existing_results = self.session.query(SearchResult).filter_by(
-                query_id=query_id
-            ).all()
-
-            if existing_results:
-                print(f"   ℹ️  Using {len(existing_results)} existing results from database")
-                return existing_results
-
-            # Search images (not async) - returns a list
-            results = self.serp_client.search_images(query)
-
-            if results:
-                search_results = []
-                seen_urls = set()  # Track URLs within this search
-
-                for img in results:  # results is already a list
-                    image_url = img.get('image_url')
-
-                    # Skip if we've seen this URL in this search (SERP duplicates)
-                    if image_url in seen_urls:
-                        continue
-                    seen_urls.add(image_url)
-
-                    # Check if this result already exists for this query
-                    existing_result = self.session.query(SearchResult).filter_by(
-                        query_id=query_id,
-                        url=img.get('source_url', '')
-                    ).first()
-
-                    if not existing_result:
-                        # Create search result
-                        result = SearchResult(
-                            query_id=query_id,
-                            title=img.get('title', '')[:500],
-                            url=img.get('source_url', ''),
-                            image_url=image_url,
-                            page_url=img.get('source_url', ''),
-                            source_domain=img.get('domain', ''),
-                            position=img.get('position', 0)
-                        )
-                        self.session.add(result)
-                        search_results.append(result)
-                    else:
-                        search_results.append(existing_result)
 
-                try:
-                    self.session.commit()
-                except Exception as commit_error:
-                    self.session.rollback()
-                    print(f"   ⚠️  Commit failed, using rollback: {str(commit_error)[:100]}")
-                    # Try to return existing results instead
-                    existing_results = self.session.query(SearchResult).filter_by(
-                        query_id=query_id
-                    ).all()
+                # Check if we already have results for this query
+                existing_results = self.session.query(SearchResult).options(
+                    load_only(*RESULT_FIELDS)
+                ).filter_by(query_id=query_id).all()
+
+                if existing_results:
+                    print(f"   ℹ️  Using {len(existing_results)} existing results from database")
                     return existing_results
 
-                return search_results
+                # SERP is only called by the prefetch, off the event loop. Nothing
+                # fetched means the query came back empty within SERP_TTL or failed
+                results = serp_results
+                if results is None:
+                    return []
 
-            return []
+                # Recorded once stored, even when empty, so the query waits out SERP_TTL
+                searched_at = datetime.now(timezone.utc)
+
+                if results:
+                    search_results = []
+                    new_rows = {}  # source URL -> row to insert
+
+                    # Drop SERP duplicates, keeping the first result per image URL in order
+                    seen_image_urls = set()
+                    unique_results = []
+                    for img in results:
+                        image_url = img.get('image_url')
+                        if image_url not in seen_image_urls:
+                            seen_image_urls.add(image_url)
+                            unique_results.append(img)
+                    results = unique_results
+
+                    # Look up every result already stored for this query in one query
+                    source_urls = list({img.get('source_url', '') for img in results})
+                    existing_by_url = {
+                        row.url: row for row in self.session.query(SearchResult).options(
+                            load_only(*RESULT_FIELDS)
+                        ).filter(
+                            SearchResult.query_id == query_id,
+                            SearchResult.url.in_(source_urls)
+                        )
+                    }
+
+                    for img in results:  # results is already a list
+                        image_url = img.get('image_url')
+
+                        # Check if this result already exists for this query
+                        source_url = img.get('source_url', '')
+                        existing_result = existing_by_url.get(source_url)
+
+                        if existing_result:
+                            search_results.append(existing_result)
+                        elif source_url not in new_rows:
+                            # Create search result
+                            new_rows[source_url] = dict(
+                                query_id=query_id,
+                                title=img.get('title', '')[:500],
+                                url=source_url,
+                                image_url=image_url,
+                                page_url=source_url,
+                                source_domain=img.get('domain', ''),
+                                position=img.get('position', 0)
+                            )
+
+                    try:
+                        # One multi-row INSERT for the new results
+                        if new_rows:
+                            with self.session.begin_nested():
+                                search_results.extend(self.session.scalars(
+                                    insert(SearchResult).returning(SearchResult, sort_by_parameter_order=True),
+                                    list(new_rows.values())
+                                ).all())
+                    except Exception as commit_error:
+                        print(f"   ⚠️  Insert failed, rolled back: {str(commit_error)[:100]}")
+                        # Try to return existing results instead
+                        existing_results = self.session.query(SearchResult).options(
+                            load_only(*RESULT_FIELDS)
+                        ).filter_by(query_id=query_id).all()
+                        return existing_results
+
+                    search_query.last_searched_at = searched_at
+                    return search_results
+
+                search_query.last_searched_at = searched_at
+                return []
 
         except Exception as e:
-            self.session.rollback()
             print(f"   ❌ Search failed: {e}")
             return []
 
@@ -286,28 +446,43 @@ class DPRKImagePipeline:
         screenshots = []
         print(f"   📸 Capturing screenshots for {len(results)} results...")
 
-        for result in results[:5]:  # Limit screenshots for speed
-            try:
-                screenshot_path = await self.screenshot_capture.capture_page_screenshot(
-                    result.url
-                )
-
-                if screenshot_path:
-                    screenshot = Screenshot(
-                        result_id=result.id,
-                        file_path=str(screenshot_path),
-                        capture_type='full_page',
-                        viewport_width=1920,
-                        viewport_height=1080
-                    )
-                    self.session.add(screenshot)
-                    screenshots.append(screenshot)
+        # Launch the browser once up front so concurrent captures don't each start one
+        await self.screenshot_capture.initialize()
+        semaphore = asyncio.Semaphore(SCREENSHOT_CONCURRENCY)
 
+        async def capture(result: SearchResult):
+            async with semaphore:
+                try:
+                    return await self.screenshot_capture.capture_page_screenshot(result.url)
+                except Exception as e:
+                    print(f"      ❌ Screenshot failed for {result.url}: {e}")
+                    return None
+
+        batch = results[:5]  # Limit screenshots for speed
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(capture(result)) for result in batch]
+
+        rows = [
+            dict(
+                result_id=result.id,
+                file_path=str(task.result()),
+                capture_type='full_page',
+                viewport_width=1920,
+                viewport_height=1080
+            )
+            for result, task in zip(batch, tasks, strict=True) if task.result()
+        ]
+        # Savepoint: a failed insert loses only this query's rows, not the batch
+        if rows:
+            try:
+                with self.session.begin_nested():
+                    screenshots = self.session.scalars(
+                        insert(Screenshot).returning(Screenshot), rows
+                    ).all()
             except Exception as e:
-                print(f"      ❌ Screenshot failed for {result.url}: {e}")
-                continue
+                print(f"      ❌ Storing screenshots failed: {str(e)[:100]}")
+                return []
 
-        self.session.commit()
         print(f"      ✓ Captured {len(screenshots)} screenshots")
         return screenshots
 
@@ -316,38 +491,55 @@ class DPRKImagePipeline:
         downloaded = []
         print(f"   💾 Downloading {len(results)} images...")
 
-        # Prepare download tasks
-        tasks = []
-        for result in results:
-            if result.image_url:
-                tasks.append(self.image_downloader.download_image(
-                    result.image_url,
-                    f"result_{result.id}"  # Convert to string category
-                ))
+        # Bounded concurrency: at most DOWNLOAD_CONCURRENCY requests in flight
+        semaphore = asyncio.Semaphore(DOWNLOAD_CONCURRENCY)
+
+        async def bounded_download(result: SearchResult):
+            async with semaphore:
+                try:
+                    return await self.image_downloader.download_image(
+                        result.image_url,
+                        f"result_{result.id}"  # Convert to string category
+                    )
+                except Exception as e:
+                    print(f"      ❌ Download failed for {result.image_url[:60]}: {e}")
+                    return None
+
+        to_download = [result for result in results if result.image_url]
 
         # Download in parallel
-        if tasks:
-            downloads = await asyncio.gather(*tasks, return_exceptions=True)
+        if to_download:
+            async with asyncio.TaskGroup() as tg:
+                tasks = [tg.create_task(bounded_download(result)) for result in to_download]
+            rows = []
 
-            for i, download in enumerate(downloads):
+            for result, task in zip(to_download, tasks, strict=True):
+                download = task.result()
                 if isinstance(download, dict) and download.get('file_path'):
-                    result = results[i]
-
                     # Store in database
-                    captured = CapturedImage(
+                    rows.append(dict(
                         result_id=result.id,
                         file_path=download['file_path'],
                         file_size=download.get('file_size', 0),
                         image_format=download.get('image_format', ''),
                         image_width=download.get('image_width'),
                         image_height=download.get('image_height'),
+                        thumbnail_b64=download.get('thumbnail_b64'),
                         exif_data=download.get('exif_data', {}),
                         location_data=download.get('location_data', {})
-                    )
-                    self.session.add(captured)
+                    ))
                     downloaded.append(download)
 
-            self.session.commit()
+            # Plain dicts through a Core-level executemany: no mapped instances,
+            # identity-map entries or RETURNING, since nothing reads the rows back.
+            # Savepoint: a failed insert loses only this query's rows, not the batch
+            if rows:
+                try:
+                    with self.session.begin_nested():
+                        self.session.execute(insert(CapturedImage), rows)
+                except Exception as e:
+                    print(f"      ❌ Storing images failed: {str(e)[:100]}")
+                    return []
 
         print(f"      ✓ Downloaded {len(downloaded)} images")
         return downloaded
@@ -355,19 +547,23 @@ class DPRKImagePipeline:
     async def analyze_images(self, image_paths: List[str], results: List[SearchResult]) -> List[ContentAnalysis]:
         """Analyze images with Ollama"""
         analyses = []
+        completed_ids = []
+        failed_ids = []
         print(f"   🤖 Analyzing {len(image_paths)} images...")
 
+        # Results that already have an analysis, in one query instead of one per image
+        result_ids = [result.id for result in results]
+        existing_ids = set(self.session.scalars(
+            select(ContentAnalysis.result_id).where(ContentAnalysis.result_id.in_(result_ids))
+        ))
+
         for path, result in zip(image_paths, results):
             try:
                 analysis = self.analyzer.analyze_image(path)
 
                 if analysis and 'error_message' not in analysis:
                     # Check if analysis already exists
-                    existing = self.session.query(ContentAnalysis).filter_by(
-                        result_id=result.id
-                    ).first()
-
-                    if not existing:
+                    if result.id not in existing_ids:
                         content_analysis = ContentAnalysis(
                             result_id=result.id,
                             scene_description=analysis.get('scene_description', ''),
@@ -386,17 +582,32 @@ class DPRKImagePipeline:
                             confidence_score=analysis.get('confidence_score', 0.0),
                             processing_time=analysis.get('processing_time', 0.0)
                         )
-                        self.session.add(content_analysis)
                         analyses.append(content_analysis)
 
                     # Update search result status
-                    result.analysis_status = 'completed'
+                    completed_ids.append(result.id)
 
             except Exception as e:
                 print(f"      ❌ Analysis failed: {e}")
-                result.analysis_status = 'failed'
+                failed_ids.append(result.id)
+
+        # Savepoint: a failed write loses only this query's analyses, not the batch.
+        # One UPDATE per status instead of one per result at flush time
+        try:
+            with self.session.begin_nested():
+                self.session.add_all(analyses)
+                for status, ids in (('completed', completed_ids), ('failed', failed_ids)):
+                    if ids:
+                        self.session.execute(
+                            update(SearchResult)
+                            .where(SearchResult.id.in_(ids))
+                            .values(analysis_status=status)
+                            .execution_options(synchronize_session=False)
+                        )
+        except Exception as e:
+            print(f"      ❌ Storing analyses failed: {str(e)[:100]}")
+            return []
 
-        self.session.commit()
         print(f"      ✓ Analyzed {len(analyses)} images")
         return analyses
 
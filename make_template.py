@@ -59,9 +59,7 @@ def create_template(path):
     ]
 
     # Write headers into the first row
-    for col_idx, header in enumerate(headers, start=1):
-        cell = ws.cell(row=1, column=col_idx)
-        cell.value = header
+    ws.append(headers)
 
     # Optionally: freeze the header row so it's always visible
     ws.freeze_panes = "A2"
@@ -17,26 +17,33 @@ from database.connection import get_session
 from database.article_models import ArticleContent, ArticleAnalysis
 from sqlalchemy import text
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
 from utils.ollama_analyzer import OllamaAnalyzer
 
+# Analyses in flight at once; calls are bound by model latency, not local CPU
+DEFAULT_MAX_CONCURRENT = 16
+
 
 class ArticleAnalysisProcessor:
     """Analyze article content using Gemma3:12b model"""
 
-    def __init__(self):
-        self.session = get_session()
+    def __init__(self, session: Optional[Session] = None):
+        self.session = session or get_session()
         self.ollama_analyzer = OllamaAnalyzer(model="gemma3:12b")
         self.processed_count = 0
         self.success_count = 0
         self.error_count = 0
 
-    async def process_pending_analysis(self, limit: int = None, max_concurrent: int = 3):
+    async def process_pending_analysis(self, limit: int = None,
+                                       max_concurrent: int = DEFAULT_MAX_CONCURRENT,
+                                       max_rps: float = None):
         """
         Process articles without analysis
 
         Args:
             limit: Maximum number of articles to analyze
             max_concurrent: Maximum concurrent analysis tasks
+            max_rps: Maximum analysis requests started per second (unlimited if None)
         """
         print("=" * 60)
         print("ARTICLE CONTENT ANALYSIS PROCESSOR")
@@ -72,10 +79,15 @@ class ArticleAnalysisProcessor:
 
         print(f"🤖 Using Gemma3:12b model for analysis")
         print(f"🔄 Max concurrent: {max_concurrent} tasks")
+        if max_rps:
+            print(f"⏱️  Rate limit: {max_rps} requests/s")
 
         # Process with controlled concurrency
         start_time = datetime.now()
         semaphore = asyncio.Semaphore(max_concurrent)
+        self._min_interval = 1 / max_rps if max_rps else 0
+        self._next_start = time.monotonic()
+        self._rate_lock = asyncio.Lock()
 
         # Create tasks
         tasks = []
@@ -104,6 +116,7 @@ class ArticleAnalysisProcessor:
     async def _analyze_with_semaphore(self, semaphore: asyncio.Semaphore, article):
         """Analyze single article with semaphore control"""
         async with semaphore:
+            await self._wait_for_rate_slot()
             try:
                 result = await self._analyze_article_content(article)
                 if result:
@@ -118,6 +131,17 @@ class ArticleAnalysisProcessor:
 
             self.processed_count += 1
 
+    async def _wait_for_rate_slot(self):
+        """Space request starts at least 1/max_rps seconds apart"""
+        if not self._min_interval:
+            return
+
+        async with self._rate_lock:
+            now = time.monotonic()
+            if self._next_start > now:
+                await asyncio.sleep(self._next_start - now)
+            self._next_start = max(now, self._next_start) + self._min_interval
+
     async def _analyze_article_content(self, article) -> Optional[Dict]:
         """Analyze article content using Gemma3:12b"""
 
@@ -378,12 +402,7 @@ Provide only valid JSON in your response."""
             JOIN article_results ar ON aa.result_id = ar.id
             WHERE aa.concern_level IN ('high', 'critical')
             AND aa.error_message IS NULL
-            ORDER BY
-                CASE aa.concern_level
-                    WHEN 'critical' THEN 2
-                    WHEN 'high' THEN 1
-                    ELSE 0
-                END DESC
+            ORDER BY aa.priority_score DESC
             LIMIT 5
         """)).fetchall()
 
@@ -403,8 +422,10 @@ def main():
     parser = argparse.ArgumentParser(description='Process article content analysis')
     parser.add_argument('--limit', type=int, default=None,
                        help='Limit number of articles to analyze')
-    parser.add_argument('--max-concurrent', type=int, default=3,
+    parser.add_argument('--max-concurrent', type=int, default=DEFAULT_MAX_CONCURRENT,
                        help='Maximum concurrent analysis tasks')
+    parser.add_argument('--max-rps', type=float, default=None,
+                       help='Maximum analysis requests started per second')
     parser.add_argument('--stats-only', action='store_true',
                        help='Only show statistics, do not process')
 
@@ -420,7 +441,8 @@ def main():
     try:
         asyncio.run(processor.process_pending_analysis(
             limit=args.limit,
-            max_concurrent=args.max_concurrent
+            max_concurrent=args.max_concurrent,
+            max_rps=args.max_rps
         ))
 
         # Show final statistics
@@ -5,9 +5,9 @@ import sys
 import os
 import time
 import asyncio
-import aiohttp
+import httpx
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import Dict, Optional
 from pathlib import Path
 
 # Add project root to path
@@ -17,13 +17,22 @@ from database.connection import get_session
 from database.article_models import ArticleResult, ArticleContent
 from sqlalchemy import text
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+# Firecrawl request and connect timeouts, in seconds
+SCRAPE_TIMEOUT = 45
+CONNECT_TIMEOUT = 10
+
+# Seconds to keep idle Firecrawl connections open
+KEEPALIVE_TIMEOUT = 60
 
 
 class ArticleContentProcessor:
     """Process article URLs and extract content using Firecrawl"""
 
-    def __init__(self):
-        self.session = get_session()
+    def __init__(self, session: Optional[Session] = None,
+                 http: Optional[httpx.AsyncClient] = None):
+        self.session = session or get_session()
         self.processed_count = 0
         self.success_count = 0
         self.error_count = 0
@@ -34,9 +43,14 @@ class ArticleContentProcessor:
             raise ValueError("FIRECRAWL_API_KEY not found in environment variables")
 
         self.firecrawl_base_url = "https://api.firecrawl.dev/v1"
+        self.headers = {
+            'Authorization': f'Bearer {self.firecrawl_api_key}',
+            'Content-Type': 'application/json'
+        }
+        self.timeout = httpx.Timeout(SCRAPE_TIMEOUT, connect=CONNECT_TIMEOUT)
 
-        # Will initialize connector when needed
-        self.connector = None
+        # Shared HTTP client; when none is passed in, each run opens its own
+        self.http = http
 
     async def process_pending_articles(self, limit: int = None, batch_size: int = 50):
         """
@@ -77,29 +91,56 @@ class ArticleContentProcessor:
             print("✅ No pending articles to process!")
             return
 
-        print(f"🔄 Batch size: {batch_size} concurrent requests")
+        print(f"🔄 Window size: {batch_size} concurrent requests")
         print(f"🚀 Optimized for Firecrawl's 50-concurrent limit")
 
-        # Process in batches
-        start_time = datetime.now()
-
-        for i in range(0, len(pending_articles), batch_size):
-            batch = pending_articles[i:i + batch_size]
-            batch_num = (i // batch_size) + 1
-            total_batches = (len(pending_articles) - 1) // batch_size + 1
+        # One HTTP/2 client for the whole run: the window's requests are multiplexed
+        # over a single TLS connection to Firecrawl instead of one socket each
+        owns_http = self.http is None
+        if owns_http:
+            self.http = httpx.AsyncClient(
+                http2=True,
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=batch_size,
+                    max_keepalive_connections=batch_size,
+                    keepalive_expiry=KEEPALIVE_TIMEOUT
+                ),
+                headers=self.headers
+            )
 
-            print(f"\n🔍 Processing batch {batch_num}/{total_batches} ({len(batch)} articles)")
-
-            await self._process_batch(batch)
-
-            # Progress indicator for large batches
-            if self.processed_count % 100 == 0 and self.processed_count > 0:
-                elapsed = datetime.now() - start_time
-                rate = self.processed_count / elapsed.total_seconds()
-                remaining = len(pending_articles) - self.processed_count
-                eta = remaining / rate if rate > 0 else 0
-                print(f"   📈 Progress: {self.processed_count}/{len(pending_articles)} | "
-                      f"Rate: {rate:.1f}/s | ETA: {eta/60:.1f}m")
+        try:
+            # Keep batch_size requests in flight: a new article is submitted as soon as
+            # any one finishes, instead of waiting for the slowest in a fixed batch
+            start_time = datetime.now()
+            remaining_articles = iter(pending_articles)
+            inflight = {}
+
+            while True:
+                for article in remaining_articles:
+                    inflight[asyncio.ensure_future(self._scrape_article_content(article))] = article
+                    if len(inflight) >= batch_size:
+                        break
+
+                if not inflight:
+                    break
+
+                done, _ = await asyncio.wait(inflight, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    self._record_result(inflight.pop(task), task)
+
+                    # Progress indicator for large runs
+                    if self.processed_count % 100 == 0:
+                        elapsed = datetime.now() - start_time
+                        rate = self.processed_count / elapsed.total_seconds()
+                        remaining = len(pending_articles) - self.processed_count
+                        eta = remaining / rate if rate > 0 else 0
+                        print(f"   📈 Progress: {self.processed_count}/{len(pending_articles)} | "
+                              f"Rate: {rate:.1f}/s | ETA: {eta/60:.1f}m")
+        finally:
+            if owns_http:
+                await self.http.aclose()
+                self.http = None
 
         # Final statistics
         duration = datetime.now() - start_time
@@ -115,34 +156,21 @@ class ArticleContentProcessor:
         print(f"⏱️  Total duration: {duration}")
         print(f"🔄 Average per article: {duration.total_seconds() / self.processed_count:.1f}s")
 
-    async def _process_batch(self, batch: List):
-        """Process a batch of articles concurrently"""
-
-        tasks = []
-        for article in batch:
-            task = self._scrape_article_content(article)
-            tasks.append(task)
-
-        # Execute batch concurrently
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Process results
-        batch_success = 0
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                print(f"      ❌ {batch[i].url[:60]}... - {str(result)[:50]}")
-                self.error_count += 1
-            elif result:
-                print(f"      ✅ {batch[i].url[:60]}... - {len(result.get('content', ''))} chars")
-                batch_success += 1
-                self.success_count += 1
-            else:
-                print(f"      ⚠️  {batch[i].url[:60]}... - No content extracted")
-                self.error_count += 1
+    def _record_result(self, article, task: asyncio.Future):
+        """Tally and report one finished scrape"""
 
-            self.processed_count += 1
+        result = task.exception() or task.result()
+        if isinstance(result, Exception):
+            print(f"      ❌ {article.url[:60]}... - {str(result)[:50]}")
+            self.error_count += 1
+        elif result:
+            print(f"      ✅ {article.url[:60]}... - {len(result.get('content', ''))} chars")
+            self.success_count += 1
+        else:
+            print(f"      ⚠️  {article.url[:60]}... - No content extracted")
+            self.error_count += 1
 
-        print(f"   Batch result: {batch_success}/{len(batch)} successful")
+        self.processed_count += 1
 
     async def _scrape_article_content(self, article) -> Optional[Dict]:
         """Scrape content from a single article URL"""
@@ -156,58 +184,52 @@ class ArticleContentProcessor:
                 raise ValueError(f"Invalid URL: {url}")
 
             # Make API request to Firecrawl
-            timeout = aiohttp.ClientTimeout(total=45)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                headers = {
-                    'Authorization': f'Bearer {self.firecrawl_api_key}',
-                    'Content-Type': 'application/json'
+            payload = {
+                'url': url,
+                'formats': ['markdown', 'html'],
+                'onlyMainContent': True,
+                'removeBase64Images': True,
+                'timeout': 30000  # 30 seconds
+            }
+
+            response = await self.http.post(
+                f"{self.firecrawl_base_url}/scrape",
+                json=payload,
+                headers=self.headers,
+                timeout=self.timeout
+            )
+
+            if response.status_code == 200:
+                result = response.json()
+
+                # Extract content and metadata
+                content_data = {
+                    'markdown_content': result.get('data', {}).get('markdown', ''),
+                    'raw_html': result.get('data', {}).get('html', ''),
+                    'cleaned_text': result.get('data', {}).get('markdown', ''),  # Use markdown as cleaned text
+                    'word_count': self._count_words(result.get('data', {}).get('markdown', '')),
+                    'language': result.get('data', {}).get('metadata', {}).get('language', 'unknown'),
+                    'scraped_at': datetime.utcnow(),
+                    'scrape_success': True,
+                    'scrape_method': 'firecrawl'
                 }
 
-                payload = {
-                    'url': url,
-                    'formats': ['markdown', 'html'],
-                    'onlyMainContent': True,
-                    'removeBase64Images': True,
-                    'timeout': 30000  # 30 seconds
-                }
+                # Store in database
+                await self._store_content(article.id, content_data)
 
-                async with session.post(
-                    f"{self.firecrawl_base_url}/scrape",
-                    json=payload,
-                    headers=headers
-                ) as response:
-
-                    if response.status == 200:
-                        result = await response.json()
-
-                        # Extract content and metadata
-                        content_data = {
-                            'markdown_content': result.get('data', {}).get('markdown', ''),
-                            'raw_html': result.get('data', {}).get('html', ''),
-                            'cleaned_text': result.get('data', {}).get('markdown', ''),  # Use markdown as cleaned text
-                            'word_count': self._count_words(result.get('data', {}).get('markdown', '')),
-                            'language': result.get('data', {}).get('metadata', {}).get('language', 'unknown'),
-                            'scraped_at': datetime.utcnow(),
-                            'scrape_success': True,
-                            'scrape_method': 'firecrawl'
-                        }
-
-                        # Store in database
-                        await self._store_content(article.id, content_data)
-
-                        return content_data
-
-                    else:
-                        error_msg = f"HTTP {response.status}"
-                        try:
-                            error_data = await response.json()
-                            error_msg = error_data.get('error', error_msg)
-                        except:
-                            pass
-
-                        # Store error in database
-                        await self._store_error(article.id, error_msg, 'firecrawl')
-                        raise Exception(error_msg)
+                return content_data
+
+            else:
+                error_msg = f"HTTP {response.status_code}"
+                try:
+                    error_data = response.json()
+                    error_msg = error_data.get('error', error_msg)
+                except:
+                    pass
+
+                # Store error in database
+                await self._store_error(article.id, error_msg, 'firecrawl')
+                raise Exception(error_msg)
 
         except Exception as e:
             # Store error in database
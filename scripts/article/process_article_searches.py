@@ -4,7 +4,7 @@
 import sys
 import os
 from datetime import datetime
-from typing import List, Dict
+from typing import List, Dict, Optional
 from pathlib import Path
 
 # Add project root to path
@@ -15,14 +15,15 @@ from database.article_models import ArticleSearch, ArticleResult
 from search.serp_web_client import SerpWebClient
 from search_terms.dprk_images_search_terms_3 import search_packs
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
 
 
 class ArticleSearchProcessor:
     """Process article searches from search terms pack 3"""
 
-    def __init__(self):
+    def __init__(self, session: Optional[Session] = None):
         self.serp_client = SerpWebClient()
-        self.session = get_session()
+        self.session = session or get_session()
         self.processed_count = 0
         self.total_results = 0
 
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""Backfill stored dashboard thumbnails for previously captured images"""
+
+import sys
+from database.connection import get_session
+from database.models import CapturedImage
+from utils.thumbnail import create_thumbnail
+
+def backfill_thumbnails(batch_size=200):
+    """Encode and store thumbnails for images that do not have one yet"""
+    session = get_session()
+
+    print("=" * 60)
+    print("BACKFILLING IMAGE THUMBNAILS")
+    print("=" * 60)
+
+    try:
+        total = session.query(CapturedImage).filter(
+            CapturedImage.thumbnail_b64.is_(None)
+        ).count()
+        print(f"\n📊 Found {total} images without thumbnails")
+
+        processed = 0
+        failed = 0
+        last_id = 0
+
+        while True:
+            batch = session.query(CapturedImage).filter(
+                CapturedImage.thumbnail_b64.is_(None),
+                CapturedImage.id > last_id
+            ).order_by(CapturedImage.id).limit(batch_size).all()
+
+            if not batch:
+                break
+
+            for captured in batch:
+                thumbnail = create_thumbnail(captured.file_path)
+                if thumbnail:
+                    captured.thumbnail_b64 = thumbnail
+                    processed += 1
+                else:
+                    failed += 1
+
+            last_id = batch[-1].id
+            session.commit()
+            print(f"   ✓ {processed}/{total} thumbnails stored ({failed} failed)")
+
+    except Exception as e:
+        print(f"\n❌ Backfill failed: {e}")
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
+    print("\n" + "=" * 60)
+    print("✅ BACKFILL COMPLETED")
+    print("=" * 60)
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        backfill_thumbnails(int(sys.argv[1]))
+    else:
+        backfill_thumbnails()
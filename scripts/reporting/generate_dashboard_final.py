@@ -1,33 +1,30 @@
 #!/usr/bin/env python3
 """Generate improved dashboard data with URLs and proper structure"""
 
-import json
-import base64
-from PIL import Image
-import io
+import orjson
+import os
 from pathlib import Path
 from database.connection import get_session
 from database.models import CapturedImage, ContentAnalysis, SearchResult
-from sqlalchemy import func
-
-def create_thumbnail(image_path, max_size=(200, 200)):
-    """Create a base64 encoded thumbnail"""
-    try:
-        with Image.open(image_path) as img:
-            # Convert RGBA to RGB if necessary
-            if img.mode == 'RGBA':
-                background = Image.new('RGB', img.size, (255, 255, 255))
-                background.paste(img, mask=img.split()[3])
-                img = background
-
-            img.thumbnail(max_size)
-            buffer = io.BytesIO()
-            img.save(buffer, format='JPEG', quality=85)
-            buffer.seek(0)
-            return base64.b64encode(buffer.getvalue()).decode()
-    except Exception as e:
-        print(f"Error creating thumbnail for {image_path}: {e}")
-        return None
+from sqlalchemy import func, select
+from utils.thumbnail import create_thumbnail
+
+def find_existing_files(file_paths):
+    """Return the subset of file_paths that exist, scanning each parent directory once"""
+    by_parent = {}
+    for file_path in file_paths:
+        path = Path(file_path)
+        by_parent.setdefault(path.parent, []).append(path)
+
+    existing = set()
+    for parent, paths in by_parent.items():
+        try:
+            with os.scandir(parent) as entries:
+                names = {entry.name for entry in entries}
+        except OSError:
+            continue
+        existing.update(str(path) for path in paths if path.name in names)
+    return existing
 
 def main():
     session = get_session()
@@ -55,52 +52,64 @@ def main():
         print(f"   Gemma processed: {gemma_count}")
 
         # Get distinct images with analysis (avoiding duplicates)
-        # First get unique result_ids
-        unique_result_ids = session.query(
-            CapturedImage.result_id
+        # First pick one image per analysed result
+        first_images = select(
+            func.min(CapturedImage.id)
         ).join(
             ContentAnalysis, CapturedImage.result_id == ContentAnalysis.result_id
-        ).distinct().limit(100).subquery()
-
-        # Then get full data for those result_ids
-        images_query = session.query(
-            CapturedImage,
-            ContentAnalysis,
-            SearchResult
+        ).group_by(CapturedImage.result_id).limit(100)
+
+        # Then project only the columns the dashboard needs
+        images_stmt = select(
+            CapturedImage.id,
+            CapturedImage.file_name,
+            CapturedImage.file_path,
+            CapturedImage.thumbnail_b64,
+            ContentAnalysis.scene_description,
+            ContentAnalysis.concern_level,
+            ContentAnalysis.gemma_description,
+            ContentAnalysis.gemma_concern_level,
+            ContentAnalysis.personnel_count,
+            SearchResult.url,
+            SearchResult.page_url,
+            SearchResult.source_domain
         ).join(
             ContentAnalysis, CapturedImage.result_id == ContentAnalysis.result_id
         ).join(
             SearchResult, CapturedImage.result_id == SearchResult.id
-        ).filter(
-            CapturedImage.result_id.in_(session.query(unique_result_ids))
-        ).distinct(CapturedImage.result_id)
+        ).where(
+            CapturedImage.id.in_(first_images)
+        )
+
+        rows = session.execute(images_stmt).all()
+        existing_files = find_existing_files(row.file_path for row in rows)
 
         images_data = []
 
-        for img, analysis, result in images_query:
+        for row in rows:
             # Check if file exists
-            if not Path(img.file_path).exists():
+            if str(Path(row.file_path)) not in existing_files:
                 continue
 
-            # Create thumbnail
-            thumbnail = create_thumbnail(img.file_path)
+            # Use the thumbnail stored at capture time, encoding only legacy rows
+            thumbnail = row.thumbnail_b64 or create_thumbnail(row.file_path)
 
             # Prepare image data
             img_data = {
-                "id": img.id,
-                "file_name": img.file_name,
+                "id": row.id,
+                "file_name": row.file_name,
                 "thumbnail": thumbnail,
-                "source_url": result.url,
-                "page_url": result.page_url,
-                "source_domain": result.source_domain,
+                "source_url": row.url,
+                "page_url": row.page_url,
+                "source_domain": row.source_domain,
                 # Analysis data
-                "scene_description": analysis.scene_description,
-                "concern_level": analysis.concern_level,
-                "gemma_description": analysis.gemma_description,
-                "gemma_concern_level": analysis.gemma_concern_level,
-                "personnel_count": analysis.personnel_count or 0,
-                "has_llava": bool(analysis.scene_description),
-                "has_gemma": bool(analysis.gemma_description)
+                "scene_description": row.scene_description,
+                "concern_level": row.concern_level,
+                "gemma_description": row.gemma_description,
+                "gemma_concern_level": row.gemma_concern_level,
+                "personnel_count": row.personnel_count or 0,
+                "has_llava": bool(row.scene_description),
+                "has_gemma": bool(row.gemma_description)
             }
 
             images_data.append(img_data)
@@ -119,8 +128,8 @@ def main():
         }
 
         # Save to JSON
-        with open('dashboard_data.json', 'w', encoding='utf-8') as f:
-            json.dump(dashboard_data, f, indent=2, ensure_ascii=False)
+        with open('dashboard_data.json', 'wb') as f:
+            f.write(orjson.dumps(dashboard_data, option=orjson.OPT_INDENT_2))
 
         print(f"✅ Saved dashboard data to dashboard_data.json")
         print(f"   Images with thumbnails: {len([d for d in images_data if d['thumbnail']])}")
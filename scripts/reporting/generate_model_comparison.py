@@ -2,18 +2,123 @@
 """Generate comprehensive model comparison report between gemma3n:e4b and gemma3:12b"""
 
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from database.connection import get_session
+from openpyxl import Workbook
+from database.connection import get_engine
+from database.comparison_views import refresh_model_comparison_stats
 from database.models import ContentAnalysis
 from sqlalchemy import text
 import json
+import re
+
+
+def _write_sheet(wb, name, df):
+    """Append a DataFrame to a write-only workbook, mapping NaN to empty cells"""
+    ws = wb.create_sheet(name)
+    ws.append(list(df.columns))
+    for row in df.astype(object).where(df.notna(), None).itertuples(index=False, name=None):
+        ws.append(row)
+
+
+def _read_sql_streamed(query, conn, chunksize=1000):
+    """Read a query through a server-side cursor, assembling the frame chunk by chunk"""
+    chunks = pd.read_sql(query.execution_options(stream_results=True), conn, chunksize=chunksize)
+    return pd.concat(chunks, ignore_index=True)
+
+
+def _overlapping_indicators(indicators, others):
+    """Return indicators that contain, or are contained in, any of the other model's indicators"""
+    others = [other.lower() for other in others]
+    # One joined haystack answers "is contained in" and one alternation answers "contains"
+    haystack = '\n'.join(others)
+    contains = re.compile('|'.join(map(re.escape, others)))
+    return [
+        indicator for indicator in indicators
+        if indicator.lower() in haystack or contains.search(indicator.lower())
+    ]
+
+
+def load_statistics(conn):
+    """Refresh and read the model_comparison_stats materialized view"""
+    refresh_model_comparison_stats(conn)
+    stats_df = pd.read_sql(text("""
+        SELECT *
+        FROM model_comparison_stats
+        ORDER BY
+            section,
+            CASE concern_level
+                WHEN 'critical' THEN 4
+                WHEN 'high' THEN 3
+                WHEN 'medium' THEN 2
+                ELSE 1
+            END DESC,
+            total DESC
+    """), conn)
+    conn.commit()
+    return stats_df
+
+
+def load_disagreements(conn):
+    """Read the top disagreement cases between the two models"""
+    return _read_sql_streamed(text("""
+        SELECT
+            result_id,
+            LEFT(scene_description, 200) as scene_description,
+            gemma_concern_level,
+            LEFT(gemma_description, 200) as gemma_description,
+            gemma12b_concern_level,
+            LEFT(gemma12b_description, 200) as gemma12b_description,
+            ensemble_concern_level
+        FROM content_analysis
+        WHERE gemma_concern_level IS NOT NULL
+        AND gemma12b_concern_level IS NOT NULL
+        AND gemma_concern_level != gemma12b_concern_level
+        ORDER BY
+            CASE
+                WHEN gemma_concern_level = 'critical' OR gemma12b_concern_level = 'critical' THEN 4
+                WHEN gemma_concern_level = 'high' OR gemma12b_concern_level = 'high' THEN 3
+                WHEN gemma_concern_level = 'medium' OR gemma12b_concern_level = 'medium' THEN 2
+                ELSE 1
+            END DESC
+        LIMIT 100
+    """), conn)
+
+
+def load_indicator_sample(conn):
+    """Read a sample of images with indicators from both models"""
+    return _read_sql_streamed(text("""
+        SELECT
+            result_id,
+            gemma_indicators,
+            gemma12b_indicators
+        FROM content_analysis
+        WHERE array_length(gemma_indicators, 1) > 0
+        AND array_length(gemma12b_indicators, 1) > 0
+        LIMIT 50
+    """), conn)
+
+
+# Independent queries fetched concurrently before any sheet is written
+LOADERS = {
+    'statistics': load_statistics,
+    'disagreements': load_disagreements,
+    'indicators': load_indicator_sample,
+}
+
+
+def _run_loader(engine, loader):
+    """Run a loader on its own pooled connection"""
+    with engine.connect() as conn:
+        return loader(conn)
 
 
 def generate_model_comparison():
     """Generate detailed comparison report between gemma3n:e4b and gemma3:12b models"""
 
-    session = get_session()
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    engine = get_engine()
+    now = datetime.now()
+    timestamp = f"{now:%Y%m%d_%H%M%S}"
     output_file = f"model_comparison_report_{timestamp}.xlsx"
 
     print("="*60)
@@ -21,33 +126,32 @@ def generate_model_comparison():
     print("="*60)
     print("Comparing: gemma3n:e4b vs gemma3:12b")
 
-    # Create Excel writer
-    writer = pd.ExcelWriter(output_file, engine='openpyxl')
+    # Write-only workbook streams rows to disk instead of holding every cell in memory
+    wb = Workbook(write_only=True)
 
     try:
+        # Fetch all sections in parallel, one connection per worker
+        print("\n📊 Querying statistics, disagreements and indicators...")
+        with ThreadPoolExecutor(max_workers=len(LOADERS)) as executor:
+            futures = {
+                name: executor.submit(_run_loader, engine, loader)
+                for name, loader in LOADERS.items()
+            }
+            frames = {name: future.result() for name, future in futures.items()}
+
         # 1. Overview Statistics
-        print("\n📊 Gathering overview statistics...")
-
-        stats_query = session.execute(text("""
-            SELECT
-                COUNT(*) as total_analyzed,
-                COUNT(CASE WHEN gemma_description IS NOT NULL THEN 1 END) as with_gemma3n,
-                COUNT(CASE WHEN gemma12b_description IS NOT NULL THEN 1 END) as with_gemma12b,
-                COUNT(CASE WHEN gemma_description IS NOT NULL
-                      AND gemma12b_description IS NOT NULL THEN 1 END) as with_both,
-                AVG(CASE WHEN gemma_processing_time IS NOT NULL
-                    THEN gemma_processing_time END) as avg_gemma3n_time,
-                AVG(CASE WHEN gemma12b_processing_time IS NOT NULL
-                    THEN gemma12b_processing_time END) as avg_gemma12b_time
-            FROM content_analysis
-        """))
-        stats = stats_query.fetchone()
+        print("📊 Gathering overview statistics...")
+
+        stats_df = frames['statistics']
+        sections = {name: df for name, df in stats_df.groupby('section')}
+        overview = sections['overview']
+        stats = overview.astype(object).where(overview.notna(), None).iloc[0]
 
         overview_data = [
-            ['Report Generated', datetime.now().strftime("%Y-%m-%d %H:%M:%S")],
+            ['Report Generated', f"{now:%Y-%m-%d %H:%M:%S}"],
             ['', ''],
             ['MODEL COMPARISON OVERVIEW', ''],
-            ['Total Images Analyzed', stats.total_analyzed],
+            ['Total Images Analyzed', stats.total],
             ['Processed with gemma3n:e4b', stats.with_gemma3n],
             ['Processed with gemma3:12b', stats.with_gemma12b],
             ['Processed with both models', stats.with_both],
@@ -55,213 +159,108 @@ def generate_model_comparison():
             ['PERFORMANCE METRICS', ''],
             ['Avg Processing Time - gemma3n:e4b', f'{stats.avg_gemma3n_time:.2f} seconds' if stats.avg_gemma3n_time else 'N/A'],
             ['Avg Processing Time - gemma3:12b', f'{stats.avg_gemma12b_time:.2f} seconds' if stats.avg_gemma12b_time else 'N/A'],
-            ['Speed Difference', f'{abs(stats.avg_gemma12b_time - stats.avg_gemma3n_time):.2f} seconds'
-             if stats.avg_gemma3n_time and stats.avg_gemma12b_time else 'N/A']
+            ['Speed Difference', f'{stats.speed_diff:.2f} seconds' if stats.speed_diff is not None else 'N/A']
         ]
 
         df_overview = pd.DataFrame(overview_data, columns=['Metric', 'Value'])
-        df_overview.to_excel(writer, sheet_name='Overview', index=False)
+        _write_sheet(wb, 'Overview', df_overview)
 
         # 2. Concern Level Agreement Analysis
         print("📈 Analyzing concern level agreements...")
 
-        agreement_query = session.execute(text("""
-            SELECT
-                gemma_concern_level,
-                gemma12b_concern_level,
-                COUNT(*) as count
-            FROM content_analysis
-            WHERE gemma_concern_level IS NOT NULL
-            AND gemma12b_concern_level IS NOT NULL
-            GROUP BY gemma_concern_level, gemma12b_concern_level
-            ORDER BY count DESC
-        """))
-
-        agreement_data = []
-        total_comparisons = 0
-        exact_matches = 0
-
-        for row in agreement_query:
-            agreement_data.append({
-                'Gemma3n:e4b Level': row.gemma_concern_level,
-                'Gemma3:12b Level': row.gemma12b_concern_level,
-                'Count': row.count,
-                'Agreement': 'Yes' if row.gemma_concern_level == row.gemma12b_concern_level else 'No'
-            })
-            total_comparisons += row.count
-            if row.gemma_concern_level == row.gemma12b_concern_level:
-                exact_matches += row.count
+        df = sections.get('agreement', stats_df.iloc[0:0])
+        df_agreement = pd.DataFrame({
+            'Gemma3n:e4b Level': df['gemma_concern_level'],
+            'Gemma3:12b Level': df['gemma12b_concern_level'],
+            'Count': df['total'],
+            'Agreement': df['gemma_concern_level'].eq(df['gemma12b_concern_level']).map({True: 'Yes', False: 'No'})
+        })
 
-        if agreement_data:
-            df_agreement = pd.DataFrame(agreement_data)
-            df_agreement.to_excel(writer, sheet_name='Concern Agreement', index=False)
+        if not df_agreement.empty:
+            _write_sheet(wb, 'Concern Agreement', df_agreement)
 
-            agreement_rate = (exact_matches / total_comparisons * 100) if total_comparisons > 0 else 0
+            agreement_rate = (stats.exact_matches / stats.compared * 100) if stats.compared > 0 else 0
             print(f"   Agreement rate: {agreement_rate:.1f}%")
 
         # 3. Disagreement Cases
         print("⚠️  Finding disagreement cases...")
 
-        disagreement_query = session.execute(text("""
-            SELECT
-                result_id,
-                scene_description,
-                gemma_concern_level,
-                gemma_description,
-                gemma12b_concern_level,
-                gemma12b_description,
-                ensemble_concern_level
-            FROM content_analysis
-            WHERE gemma_concern_level IS NOT NULL
-            AND gemma12b_concern_level IS NOT NULL
-            AND gemma_concern_level != gemma12b_concern_level
-            ORDER BY
-                CASE
-                    WHEN gemma_concern_level = 'critical' OR gemma12b_concern_level = 'critical' THEN 4
-                    WHEN gemma_concern_level = 'high' OR gemma12b_concern_level = 'high' THEN 3
-                    WHEN gemma_concern_level = 'medium' OR gemma12b_concern_level = 'medium' THEN 2
-                    ELSE 1
-                END DESC
-            LIMIT 100
-        """))
-
-        disagreement_data = []
-        for row in disagreement_query:
-            disagreement_data.append({
-                'Result ID': row.result_id,
-                'LLaVA Description': row.scene_description[:200] if row.scene_description else '',
-                'Gemma3n:e4b Concern': row.gemma_concern_level,
-                'Gemma3n:e4b Analysis': row.gemma_description[:200] if row.gemma_description else '',
-                'Gemma3:12b Concern': row.gemma12b_concern_level,
-                'Gemma3:12b Analysis': row.gemma12b_description[:200] if row.gemma12b_description else '',
-                'Ensemble Decision': row.ensemble_concern_level if row.ensemble_concern_level else 'N/A'
-            })
+        df = frames['disagreements']
 
-        if disagreement_data:
-            df_disagreement = pd.DataFrame(disagreement_data)
-            df_disagreement.to_excel(writer, sheet_name='Disagreement Cases', index=False)
-            print(f"   Found {len(disagreement_data)} disagreement cases")
+        df_disagreement = pd.DataFrame({
+            'Result ID': df['result_id'],
+            'LLaVA Description': df['scene_description'].fillna(''),
+            'Gemma3n:e4b Concern': df['gemma_concern_level'],
+            'Gemma3n:e4b Analysis': df['gemma_description'].fillna(''),
+            'Gemma3:12b Concern': df['gemma12b_concern_level'],
+            'Gemma3:12b Analysis': df['gemma12b_description'].fillna(''),
+            'Ensemble Decision': df['ensemble_concern_level'].fillna('N/A')
+        })
+
+        if not df_disagreement.empty:
+            _write_sheet(wb, 'Disagreement Cases', df_disagreement)
+            print(f"   Found {len(df_disagreement)} disagreement cases")
 
         # 4. Performance by Concern Level
         print("📊 Analyzing performance by concern level...")
 
-        performance_query = session.execute(text("""
-            SELECT
-                concern_level,
-                COUNT(CASE WHEN gemma_concern_level IS NOT NULL THEN 1 END) as gemma3n_count,
-                COUNT(CASE WHEN gemma12b_concern_level IS NOT NULL THEN 1 END) as gemma12b_count,
-                AVG(CASE WHEN gemma_processing_time IS NOT NULL THEN gemma_processing_time END) as avg_gemma3n_time,
-                AVG(CASE WHEN gemma12b_processing_time IS NOT NULL THEN gemma12b_processing_time END) as avg_gemma12b_time
-            FROM content_analysis
-            WHERE concern_level IS NOT NULL
-            GROUP BY concern_level
-            ORDER BY
-                CASE concern_level
-                    WHEN 'critical' THEN 4
-                    WHEN 'high' THEN 3
-                    WHEN 'medium' THEN 2
-                    ELSE 1
-                END DESC
-        """))
-
-        performance_data = []
-        for row in performance_query:
-            performance_data.append({
-                'LLaVA Concern Level': row.concern_level,
-                'Gemma3n:e4b Processed': row.gemma3n_count,
-                'Gemma3:12b Processed': row.gemma12b_count,
-                'Avg Time gemma3n:e4b (sec)': round(row.avg_gemma3n_time, 2) if row.avg_gemma3n_time else 0,
-                'Avg Time gemma3:12b (sec)': round(row.avg_gemma12b_time, 2) if row.avg_gemma12b_time else 0
-            })
+        df = sections.get('performance', stats_df.iloc[0:0])
+        df_performance = pd.DataFrame({
+            'LLaVA Concern Level': df['concern_level'],
+            'Gemma3n:e4b Processed': df['gemma3n_count'],
+            'Gemma3:12b Processed': df['gemma12b_count'],
+            'Avg Time gemma3n:e4b (sec)': pd.to_numeric(df['avg_gemma3n_time'], errors='coerce').round(2).fillna(0),
+            'Avg Time gemma3:12b (sec)': pd.to_numeric(df['avg_gemma12b_time'], errors='coerce').round(2).fillna(0)
+        })
 
-        if performance_data:
-            df_performance = pd.DataFrame(performance_data)
-            df_performance.to_excel(writer, sheet_name='Performance Analysis', index=False)
+        if not df_performance.empty:
+            _write_sheet(wb, 'Performance Analysis', df_performance)
 
         # 5. Indicator Comparison
         print("🔍 Comparing indicators detected...")
 
-        # Get sample of images with both analyses for indicator comparison
-        indicator_query = session.execute(text("""
-            SELECT
-                result_id,
-                concern_indicators,
-                restriction_indicators,
-                gemma_indicators
-            FROM content_analysis
-            WHERE gemma_indicators IS NOT NULL
-            AND array_length(gemma_indicators, 1) > 0
-            LIMIT 50
-        """))
+        df = frames['indicators']
 
         indicator_comparison = []
-        for row in indicator_query:
-            gemma3n_indicators = row.gemma_indicators[:5] if row.gemma_indicators else []
-            gemma_indicators = row.gemma_indicators[:5] if row.gemma_indicators else []
-
-            # Find overlapping indicators
-            overlap = []
-            for g3n in gemma3n_indicators:
-                for g12b in gemma_indicators:
-                    if g3n.lower() in g12b.lower() or g12b.lower() in g3n.lower():
-                        overlap.append(g3n)
-                        break
+        for row in df.itertuples(index=False):
+            gemma3n_indicators = row.gemma_indicators[:5]
+            gemma12b_indicators = row.gemma12b_indicators[:5]
+
+            # An indicator overlaps when it contains, or is contained in, one from the other model
+            overlap = _overlapping_indicators(gemma3n_indicators, gemma12b_indicators)
 
             indicator_comparison.append({
                 'Result ID': row.result_id,
                 'Gemma3n:e4b Indicators': '; '.join(gemma3n_indicators),
-                'Gemma3:12b Indicators': '; '.join(gemma_indicators),
+                'Gemma3:12b Indicators': '; '.join(gemma12b_indicators),
                 'Overlapping': '; '.join(overlap) if overlap else 'None',
                 'Ensemble Combined': '; '.join(row.gemma_indicators[:5]) if row.gemma_indicators else 'N/A'
             })
 
         if indicator_comparison:
             df_indicators = pd.DataFrame(indicator_comparison)
-            df_indicators.to_excel(writer, sheet_name='Indicator Comparison', index=False)
+            _write_sheet(wb, 'Indicator Comparison', df_indicators)
 
         # 6. Model Tendency Analysis
         print("📊 Analyzing model tendencies...")
 
-        tendency_query = session.execute(text("""
-            SELECT
-                'gemma3n:e4b' as model,
-                COUNT(CASE WHEN gemma_concern_level = 'low' THEN 1 END) as low_count,
-                COUNT(CASE WHEN gemma_concern_level = 'medium' THEN 1 END) as medium_count,
-                COUNT(CASE WHEN gemma_concern_level = 'high' THEN 1 END) as high_count,
-                COUNT(CASE WHEN gemma_concern_level = 'critical' THEN 1 END) as critical_count,
-                COUNT(*) as total
-            FROM content_analysis
-            WHERE gemma_concern_level IS NOT NULL
-            UNION ALL
-            SELECT
-                'gemma3:12b' as model,
-                COUNT(CASE WHEN gemma12b_concern_level = 'low' THEN 1 END) as low_count,
-                COUNT(CASE WHEN gemma12b_concern_level = 'medium' THEN 1 END) as medium_count,
-                COUNT(CASE WHEN gemma12b_concern_level = 'high' THEN 1 END) as high_count,
-                COUNT(CASE WHEN gemma12b_concern_level = 'critical' THEN 1 END) as critical_count,
-                COUNT(*) as total
-            FROM content_analysis
-            WHERE gemma12b_concern_level IS NOT NULL
-        """))
-
-        tendency_data = []
-        for row in tendency_query:
-            total = row.total if row.total > 0 else 1
-            tendency_data.append({
-                'Model': row.model,
-                'Low (%)': round(row.low_count * 100 / total, 1),
-                'Medium (%)': round(row.medium_count * 100 / total, 1),
-                'High (%)': round(row.high_count * 100 / total, 1),
-                'Critical (%)': round(row.critical_count * 100 / total, 1),
-                'Total Analyzed': row.total
-            })
-
-        if tendency_data:
-            df_tendency = pd.DataFrame(tendency_data)
-            df_tendency.to_excel(writer, sheet_name='Model Tendencies', index=False)
+        # Both distributions come from the overview row of model_comparison_stats,
+        # which FILTER-aggregates each model's concern levels in the same scan
+        df_tendency = pd.DataFrame([
+            {
+                'Model': model,
+                'Low (%)': getattr(stats, f'{prefix}_low_pct'),
+                'Medium (%)': getattr(stats, f'{prefix}_medium_pct'),
+                'High (%)': getattr(stats, f'{prefix}_high_pct'),
+                'Critical (%)': getattr(stats, f'{prefix}_critical_pct'),
+                'Total Analyzed': getattr(stats, f'{prefix}_count')
+            }
+            for model, prefix in (('gemma3n:e4b', 'gemma3n'), ('gemma3:12b', 'gemma12b'))
+        ])
+        _write_sheet(wb, 'Model Tendencies', df_tendency)
 
         # Save the workbook
-        writer.close()
+        wb.save(output_file)
 
         print(f"\n✅ Model comparison report completed!")
         print(f"📁 Output file: {output_file}")
@@ -290,8 +289,6 @@ def generate_model_comparison():
         print(f"\n❌ Report generation failed: {e}")
         import traceback
         traceback.print_exc()
-    finally:
-        session.close()
 
 
 if __name__ == "__main__":
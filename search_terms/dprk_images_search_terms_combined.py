@@ -1,5 +1,6 @@
 """Combined search terms for DPRK image capture - original + themed exploitation searches"""
 
+import re
 from search_terms.dprk_images_search_terms import search_terms_comprehensive
 from search_terms.dprk_images_search_terms_2 import (
     theme_construction_exploitation,
@@ -56,6 +57,33 @@ for term in theme_financial:
         'source': 'themed'
     })
 
+# Query language detection, checked in priority order against the first 20 characters.
+# Korean and Chinese only count when the text has characters above U+3000 at all
+WIDE_CHAR_RE = re.compile(r'[\u3001-\U0010FFFF]')
+WIDE_LANGUAGE_PATTERNS = [
+    ('ko', re.compile(r'[\uAC00-\uD7AF]')),  # Korean
+    ('zh', re.compile(r'[\u4E00-\u9FFF]')),  # Chinese
+]
+CYRILLIC_RE = re.compile(r'[\u0400-\u04FF]')
+
+def detect_language(term):
+    """Detect the language of a search term"""
+    prefix = term[:20]
+    if WIDE_CHAR_RE.search(prefix):
+        for language, pattern in WIDE_LANGUAGE_PATTERNS:
+            if pattern.search(prefix):
+                return language
+        return 'en'  # Other wide scripts fall back to the column default
+    if CYRILLIC_RE.search(prefix):
+        return 'ru'
+    if 'nord-coréen' in term.lower():
+        return 'fr'
+    return 'en'
+
+# The term list is fixed, so classify each term once at import
+for item in search_terms_with_themes:
+    item['language'] = detect_language(item['term'])
+
 # Summary statistics
 def print_summary():
     """Print summary of combined search terms"""
@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""Thumbnail generation shared by the capture pipeline and dashboard export"""
+
+import io
+import mmap
+import base64
+from typing import Optional, Tuple
+from PIL import Image
+
+def create_thumbnail(image_path: str, max_size: Tuple[int, int] = (200, 200)) -> Optional[str]:
+    """Create a base64 encoded JPEG thumbnail"""
+    try:
+        # Memory-map the file so the decoder reads it without an extra copy
+        with open(image_path, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+                Image.open(mm) as img:
+            # Convert RGBA to RGB if necessary
+            if img.mode == 'RGBA':
+                background = Image.new('RGB', img.size, (255, 255, 255))
+                background.paste(img, mask=img.split()[3])
+                img = background
+
+            img.thumbnail(max_size)
+            buffer = io.BytesIO()
+            # Progressive, optimized JPEG at quality 70 keeps the embedded base64 small
+            img.save(buffer, format='JPEG', quality=70, progressive=True, optimize=True)
+            buffer.seek(0)
+            return base64.b64encode(buffer.getvalue()).decode()
+    except Exception as e:
+        print(f"Error creating thumbnail for {image_path}: {e}")
+        return None